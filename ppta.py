@@ -1,9 +1,11 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
+#     "lxml",
 #     "python-pptx",
 #     "rich",
 #     "matplotlib",
+#     "numpy",
 # ]
 # ///
 
@@ -11,18 +13,35 @@
 from pptx import Presentation
 from pptx.text.text import _Paragraph
 from pptx.shapes.base import BaseShape
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterator, List, Set, Tuple, Any, Optional, Union
 import argparse
+import contextlib
+import functools
+import io
+import itertools
+import json
+import os
+import posixpath
+import sys
+import zipfile
 from pathlib import Path
 from rich.console import Console
 from rich.theme import Theme
 from rich.table import Table
 import matplotlib.font_manager as fm
+import numpy as np
 import logging
-from xml.etree import ElementTree
+from lxml import etree
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
+# numba is optional; without it the geometry statistics fall back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 INTERNAL_FONT_MARKERS = frozenset({
     '+mj-lt',    # Default Latin font for gothic text
     '+mn-lt',    # Default Latin font for mincho text
@@ -32,6 +51,10 @@ INTERNAL_FONT_MARKERS = frozenset({
     '@',         # Font fallback marker
 })
 
+# Lowercased markers as a tuple so a single str.startswith call checks them all
+_INTERNAL_FONT_PREFIXES = tuple(marker.lower() for marker in INTERNAL_FONT_MARKERS)
+_INTERNAL_FONT_FIRST_CHARS = frozenset(marker[0] for marker in _INTERNAL_FONT_PREFIXES)
+
 THEME_FONT_CODES = {
     '+mj-lt': 'Major Latin',
     '+mn-lt': 'Minor Latin',
@@ -43,6 +66,88 @@ THEME_FONT_CODES = {
     '+mn-sym': 'Minor Symbol',
 }
 
+# Where extract_theme_fonts stores the font each theme code refers to
+THEME_CODE_SLOTS = {
+    '+mj-lt': ('major_fonts', 'latin'),
+    '+mn-lt': ('minor_fonts', 'latin'),
+    '+mj-ea': ('major_fonts', 'east_asian'),
+    '+mn-ea': ('minor_fonts', 'east_asian'),
+    '+mj-cs': ('major_fonts', 'complex_script'),
+    '+mn-cs': ('minor_fonts', 'complex_script'),
+    '+mj-sym': ('major_fonts', 'symbol'),
+    '+mn-sym': ('minor_fonts', 'symbol'),
+}
+
+NS_P = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+NS_A = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+NS_R = {'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'}
+
+# Presentation sources read straight from the .pptx package rather than through python-pptx
+PACKAGE_SOURCES = (str, Path, zipfile.ZipFile)
+
+# Font names already read from font files, keyed by path and modification time
+FONT_NAME_CACHE_PATH = Path.home() / '.cache' / 'ppta' / 'fontnames.json'
+
+# XPath expressions used on every slide, compiled once
+# boolean() lets libxml2 stop at the first match instead of building a node list
+_XP_HAS_TRANSITION = etree.XPath('boolean(./p:transition)', namespaces=NS_P)
+_XP_HAS_ANIM = etree.XPath('boolean(./p:timing//*[self::p:anim or self::p:animEffect])', namespaces=NS_P)
+
+_XP_SLIDE_RIDS = etree.XPath('./p:sldIdLst/p:sldId/@r:id', namespaces={**NS_P, **NS_R}, smart_strings=False)
+_XP_MASTER_RIDS = etree.XPath('./p:sldMasterIdLst/p:sldMasterId/@r:id', namespaces={**NS_P, **NS_R}, smart_strings=False)
+SLD_TAG = f"{{{NS_P['p']}}}sld"
+
+# Parser for XML read straight from the package, without entity expansion
+_XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+# Theme font scheme elements, and the script slot each typeface element fills
+FONT_SCHEME_TAG = f"{{{NS_A['a']}}}fontScheme"
+THEME_FONT_GROUP_TAGS = {
+    f"{{{NS_A['a']}}}majorFont": "major_fonts",
+    f"{{{NS_A['a']}}}minorFont": "minor_fonts",
+}
+THEME_FONT_SLOT_TAGS = {
+    f"{{{NS_A['a']}}}latin": "latin",
+    f"{{{NS_A['a']}}}ea": "east_asian",
+    f"{{{NS_A['a']}}}cs": "complex_script",
+    f"{{{NS_A['a']}}}sym": "symbol",
+}
+FONT_SCHEME_TAGS = (FONT_SCHEME_TAG, *THEME_FONT_GROUP_TAGS, *THEME_FONT_SLOT_TAGS)
+
+# Top level shapes that can hold text (text frames and tables), and their names
+_XP_TEXT_SHAPES = etree.XPath('./p:cSld/p:spTree/p:sp | ./p:cSld/p:spTree/p:graphicFrame', namespaces=NS_P)
+TEXT_SHAPE_TAGS = frozenset({f"{{{NS_P['p']}}}sp", f"{{{NS_P['p']}}}graphicFrame"})
+_XP_SHAPE_NAME = etree.XPath('string(./*/p:cNvPr/@name)', namespaces=NS_P, smart_strings=False)
+
+# Typefaces of the text runs in a shape's text frame or table cells, i.e. the
+# same values python-pptx reports as run.font.name
+_XP_TYPEFACES = etree.XPath(
+    './p:txBody/a:p/a:r/a:rPr/a:latin/@typeface'
+    ' | ./a:graphic/a:graphicData/a:tbl/a:tr/a:tc/a:txBody/a:p/a:r/a:rPr/a:latin/@typeface',
+    namespaces={**NS_P, **NS_A},
+    smart_strings=False
+)
+
+# Position and size of the top level shapes that set them on the slide itself
+_XP_SHAPE_XFRMS = etree.XPath(
+    './p:cSld/p:spTree/*/p:spPr/a:xfrm'
+    ' | ./p:cSld/p:spTree/p:grpSp/p:grpSpPr/a:xfrm'
+    ' | ./p:cSld/p:spTree/p:graphicFrame/p:xfrm',
+    namespaces={**NS_P, **NS_A}
+)
+A_OFF_TAG = f"{{{NS_A['a']}}}off"
+A_EXT_TAG = f"{{{NS_A['a']}}}ext"
+
+EMU_PER_INCH = 914400
+GEOMETRY_COLUMNS = ("Left", "Top", "Width", "Height")
+# Row chunks the numba geometry kernel hands out to its threads
+GEOMETRY_STATS_CHUNKS = 64
+
+# Threads used to scan slides (1 scans on the calling thread), and how many
+# slides each batch hands them
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+SCAN_CHUNK_SIZE = 16
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -51,187 +156,316 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-def find_hidden_slides(pptx_path: str) -> List[int]:
-    prs = Presentation(pptx_path)
+# Font status cells, styled with the console theme below
+STATUS_INSTALLED = "[ok]Installed[/ok]"
+STATUS_MISSING = "[missing]Missing[/missing]"
+
+# Shared by all the reports
+console = Console(theme=Theme({
+    "missing": "red",
+    "ok": "green",
+    "heading": "bold blue",
+    "theme": "bold magenta"
+}))
+
+def load_presentation(presentation: Union[str, Path, Any]) -> Any:
+    """
+    Return an open presentation, opening it first if given a path.
+    
+    Lets the analysis functions accept either a path or a Presentation that
+    has already been opened, so a caller running several reports only pays
+    for unzipping and parsing the file once.
+    """
+    if isinstance(presentation, zipfile.ZipFile):
+        return Presentation(presentation.filename)
+    if isinstance(presentation, (str, Path)):
+        return Presentation(presentation)
+    return presentation
+
+@contextlib.contextmanager
+def open_package(package: Union[str, Path, zipfile.ZipFile]) -> Iterator[zipfile.ZipFile]:
+    """Open a .pptx package as a zip file, reusing it if it is already open."""
+    if isinstance(package, zipfile.ZipFile):
+        yield package
+    else:
+        with zipfile.ZipFile(package) as zf:
+            yield zf
+
+def is_slide_hidden(sld: Any) -> bool:
+    """Check whether a slide's <p:sld> element is marked as hidden."""
+    return sld.get('show') == '0'
+
+def find_slide_effects(sld: Any) -> Tuple[bool, bool]:
+    """
+    Check a single slide's <p:sld> element for transitions and animations.
+    
+    Returns:
+        Tuple containing:
+        - Whether the slide has a transition
+        - Whether the slide has animations
+    """
+    return _XP_HAS_TRANSITION(sld), _XP_HAS_ANIM(sld)
+
+def read_part_rels(zf: zipfile.ZipFile, part_name: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Read a part's relationships from a .pptx package.
+    
+    Returns:
+        Dictionary mapping relationship IDs to (relationship type, target part name)
+    """
+    base_dir, file_name = posixpath.split(part_name)
+    rels = etree.fromstring(zf.read(posixpath.join(base_dir, '_rels', f"{file_name}.rels")), _XML_PARSER)
+    
+    part_rels = {}
+    for rel in rels:
+        target = rel.get('Target')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(base_dir, target))
+        part_rels[rel.get('Id')] = (rel.get('Type'), target)
+    return part_rels
+
+def read_slide_part_names(zf: zipfile.ZipFile) -> List[str]:
+    """List the slide part names in a .pptx package, in presentation order."""
+    part_rels = read_part_rels(zf, 'ppt/presentation.xml')
+    presentation_xml = etree.fromstring(zf.read('ppt/presentation.xml'), _XML_PARSER)
+    return [part_rels[rid][1] for rid in _XP_SLIDE_RIDS(presentation_xml)]
+
+def iter_slides_streaming(pptx_path: Union[str, Path, zipfile.ZipFile]) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield each slide's <p:sld> element straight from the .pptx package.
+    
+    Slides are parsed one at a time and each tree is cleared once the caller
+    moves on, so memory use is bounded by the largest slide rather than the
+    whole deck.
+    """
+    with open_package(pptx_path) as zf:
+        for slide_num, part_name in enumerate(read_slide_part_names(zf), start=1):
+            with zf.open(part_name) as f:
+                for _, sld in etree.iterparse(f, events=('end',), tag=SLD_TAG, resolve_entities=False):
+                    yield slide_num, sld
+                    sld.clear()
+
+def iter_slide_elements(presentation: Union[str, Path, Any]) -> Iterator[Tuple[int, Any]]:
+    """
+    Yield (slide number, <p:sld> element) pairs for a path or an open Presentation.
+    
+    Paths and open zip files are streamed from the package without building a Presentation.
+    """
+    if isinstance(presentation, PACKAGE_SOURCES):
+        yield from iter_slides_streaming(presentation)
+    else:
+        for slide_num, slide in enumerate(presentation.slides, start=1):
+            yield slide_num, slide._element
+
+def find_hidden_slides(presentation: Union[str, Path, Any]) -> List[int]:
     hidden_slides = []
     
-    for slide_num, slide in enumerate(prs.slides, start=1):
-        try:
-            # Check if slide is marked as hidden
-            if hasattr(slide, '_element') and slide._element.get('show') == '0':
-                hidden_slides.append(slide_num)
-        except Exception as e:
-            logger.warning(f"Error checking slide {slide_num}: {e}")
+    # Paths are streamed from the package, like the other slide scans
+    for slide_num, sld in iter_slide_elements(presentation):
+        # Check if slide is marked as hidden
+        if is_slide_hidden(sld):
+            hidden_slides.append(slide_num)
             
     return hidden_slides
 
-def generate_hidden_slides_report(pptx_path: str):
-    hidden_slides = find_hidden_slides(pptx_path)
-    
-    console = Console(theme=Theme({
-        "heading": "bold blue"
-    }))
-
+def print_hidden_slides_report(hidden_slides: List[int]) -> None:
     console.print("\n[heading]=== Hidden Slides ===\n")
         
     if hidden_slides:
-        console.print("Hidden slides:", (", ".join(str(num) for num in sorted(hidden_slides))))
+        console.print("Hidden slides:", (", ".join(str(num) for num in hidden_slides)))
     else:
         console.print("(no hidden slides found)")
 
-def find_animations_and_transitions(pptx_path: str) -> Tuple[Set[int], Set[int]]:
+def generate_hidden_slides_report(presentation: Union[str, Path, Any]):
+    hidden_slides = find_hidden_slides(presentation)
+    print_hidden_slides_report(hidden_slides)
+
+def iter_slide_effects(presentation: Union[str, Path, Any]) -> Iterator[Tuple[int, bool, bool]]:
+    """Yield (slide number, has transition, has animation) for each slide of a path or an open Presentation."""
+    for slide_num, sld in iter_slide_elements(presentation):
+        yield slide_num, *find_slide_effects(sld)
+
+def find_animations_and_transitions(presentation: Union[str, Path, Any]) -> Tuple[List[int], List[int]]:
     """
     Find slides containing transitions or animations in a PowerPoint presentation.
     
     Args:
-        pptx_path: Path to the PowerPoint file
+        presentation: Path to the PowerPoint file, or an already opened Presentation
         
     Returns:
         Tuple containing:
-        - Set of slide numbers with transitions
-        - Set of slide numbers with animations
+        - List of slide numbers with transitions, in slide order
+        - List of slide numbers with animations, in slide order
     """
-    prs = Presentation(pptx_path)
-    slides_with_transitions = set()
-    slides_with_animations = set()
+    slides_with_transitions = []
+    slides_with_animations = []
     
-    for slide_num, slide in enumerate(prs.slides, start=1):
-        try:
-            # Check for transitions
-            transition = slide._element.find('./p:transition', 
-                                          {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-            if transition is not None:
-                slides_with_transitions.add(slide_num)
-            
-            # Check for animations
-            timing = slide._element.find('./p:timing',
-                                      {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-            if timing is not None:
-                # Look for any animation elements
-                anim_elements = timing.findall('.//p:anim',
-                                            {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-                anim_elements.extend(timing.findall('.//p:animEffect',
-                                                  {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}))
-                if anim_elements:
-                    slides_with_animations.add(slide_num)
-                    
-        except Exception as e:
-            logger.warning(f"Error processing slide {slide_num}: {e}")
-            continue
+    for slide_num, has_transition, has_animation in iter_slide_effects(presentation):
+        if has_transition:
+            slides_with_transitions.append(slide_num)
+        if has_animation:
+            slides_with_animations.append(slide_num)
             
     return slides_with_transitions, slides_with_animations
 
-def print_effects_report(slides_with_transitions: Set[int], slides_with_animations: Set[int]) -> None:
-    console = Console(theme=Theme({
-        "heading": "bold blue"
-    }))
-
+def print_effects_report(slides_with_transitions: List[int], slides_with_animations: List[int]) -> None:
     console.print("\n[heading]=== Transitions and Animations ===\n")
     
     if slides_with_transitions:
-        console.print("Slides with transitions:", (", ".join(str(num) for num in sorted(slides_with_transitions))))
+        console.print("Slides with transitions:", (", ".join(str(num) for num in slides_with_transitions)))
     else:
         console.print("(no transitions found)")
         
     if slides_with_animations:
-        console.print("Slides with animations:", (", ".join(str(num) for num in sorted(slides_with_animations))))
+        console.print("Slides with animations:", (", ".join(str(num) for num in slides_with_animations)))
     else:
         console.print("(no animations found)")
 
-def generate_effects_report(pptx_path: str):
-    transitions, animations = find_animations_and_transitions(pptx_path)
+def generate_effects_report(presentation: Union[str, Path, Any]):
+    transitions, animations = find_animations_and_transitions(presentation)
     print_effects_report(transitions, animations)
     
-def get_system_fonts() -> Set[str]:
+@functools.lru_cache(maxsize=None)
+def _font_name_for_path(path: str, mtime_ns: int) -> Optional[str]:
+    """Read the font name from a font file; mtime_ns keys the cache so edited files are re-read."""
+    try:
+        # Attempt to get the font properties
+        return fm.FontProperties(fname=path).get_name()
+    except Exception as e:
+        # Optionally print the error message if you want to debug
+        logger.debug(f"Error loading font properties for {path}: {e}")
+        return None
+
+def _load_font_name_cache() -> Dict[str, List[Any]]:
+    try:
+        with open(FONT_NAME_CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Font name cache not loaded: {e}")
+        return {}
+
+def _save_font_name_cache(cache: Dict[str, List[Any]]) -> None:
+    try:
+        FONT_NAME_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(FONT_NAME_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Font name cache not saved: {e}")
+
+def get_system_fonts() -> FrozenSet[str]:
+    """Return the canonical (see canonical_font_name) names of the installed fonts."""
     font_list: List[str] = fm.findSystemFonts(fontpaths=None)
-    font_names: List[str] = []
+    cache = _load_font_name_cache()
     
-    for font in font_list:
+    # matplotlib already read the names of every font it found when it built
+    # its own fontlist cache, which is loaded on import
+    known_names = {entry.fname: entry.name for entry in fm.fontManager.ttflist}
+    
+    def lookup(path: str) -> Tuple[str, Optional[int], Optional[str]]:
+        if path in known_names:
+            return path, None, known_names[path]
+        
         try:
-            # Attempt to get the font properties
-            font_name = fm.FontProperties(fname=font).get_name()
-            font_names.append(font_name)
-        except Exception as e:
-            # Optionally print the error message if you want to debug
-            logger.debug(f"Error loading font properties for {font}: {e}")
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError as e:
+            logger.debug(f"Error reading font file {path}: {e}")
+            return path, None, None
+        
+        # Reuse the name from a previous run if the file hasn't changed
+        cached = cache.get(path)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == mtime_ns:
+            return path, mtime_ns, cached[1]
+        return path, mtime_ns, _font_name_for_path(path, mtime_ns)
+    
+    # Reading font files is mostly I/O, so look them up in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(lookup, font_list))
+    
+    updated_cache = {path: [mtime_ns, name] for path, mtime_ns, name in results if mtime_ns is not None}
+    if updated_cache != cache:
+        _save_font_name_cache(updated_cache)
+    
+    return frozenset(canonical_font_name(name) for _, _, name in results if name)
 
-    return sorted(set(font_names))
+def read_theme_xml_from_package(pptx_path: Union[str, Path, zipfile.ZipFile]) -> Optional[bytes]:
+    """Read the theme XML of the first slide master straight from the .pptx package."""
+    with open_package(pptx_path) as zf:
+        presentation_xml = etree.fromstring(zf.read('ppt/presentation.xml'), _XML_PARSER)
+        master_rids = _XP_MASTER_RIDS(presentation_xml)
+        if not master_rids:
+            return None
+        
+        master_name = read_part_rels(zf, 'ppt/presentation.xml')[master_rids[0]][1]
+        for reltype, theme_name in read_part_rels(zf, master_name).values():
+            if reltype == RT.THEME:
+                return zf.read(theme_name)
+    return None
 
-def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
+def parse_theme_fonts(theme_blob: bytes) -> Dict[str, Any]:
+    """
+    Read the font scheme out of a theme part.
+    
+    Only the font scheme elements are handed back by the parser, and parsing
+    stops at the end of the first font scheme, so the format scheme and
+    object defaults that follow it are never read.
+    """
+    theme_fonts: Dict[str, Any] = {}
+    font_group = None
+    
+    for event, elem in etree.iterparse(io.BytesIO(theme_blob), events=('start', 'end'),
+                                       tag=FONT_SCHEME_TAGS, resolve_entities=False):
+        tag = elem.tag
+        if tag == FONT_SCHEME_TAG:
+            if event == 'end':
+                break
+            theme_fonts = {"scheme_name": elem.get('name', 'Unknown'), "major_fonts": {}, "minor_fonts": {}}
+        elif tag in THEME_FONT_GROUP_TAGS:
+            if event == 'start' and theme_fonts:
+                font_group = theme_fonts[THEME_FONT_GROUP_TAGS[tag]] = dict.fromkeys(THEME_FONT_SLOT_TAGS.values())
+            else:
+                font_group = None
+        elif event == 'end':
+            # Only the slots directly under majorFont/minorFont count, not per-script a:font entries
+            if font_group is not None and elem.getparent().tag in THEME_FONT_GROUP_TAGS:
+                slot = THEME_FONT_SLOT_TAGS[tag]
+                if font_group[slot] is None:
+                    font_group[slot] = elem.get('typeface')
+            elem.clear()
+            
+    return theme_fonts
+
+def extract_theme_fonts(presentation: Union[str, Path, Any]) -> Dict[str, Any]:
     """Extract theme font information from the presentation."""
     theme_fonts = {}
     
     try:
+        theme_blob = None
+        
+        if isinstance(presentation, PACKAGE_SOURCES):
+            # Read just the theme part rather than building a Presentation
+            theme_blob = read_theme_xml_from_package(presentation)
+            
         # Get the default theme from the first slide master
-        if presentation.slide_masters and len(presentation.slide_masters) > 0:
+        elif presentation.slide_masters and len(presentation.slide_masters) > 0:
             master = presentation.slide_masters[0]
             
             # Access the theme through the part relationships
-            try:
-                # Get the master part
-                master_part = master.part
-                
-                # Find theme relationships
-                theme_rels = [rel for rel in master_part.rels.values() 
-                             if rel.reltype == RT.THEME]
+            master_part = master.part
+            
+            # Find theme relationships
+            theme_rels = [rel for rel in master_part.rels.values() 
+                         if rel.reltype == RT.THEME]
+            
+            if theme_rels:
+                # Get the first theme part using the relationship ID
+                theme_rel = theme_rels[0]
+                theme_blob = master_part.related_part(theme_rel.rId).blob
                 
-                if theme_rels:
-                    # Get the first theme part using the relationship ID
-                    theme_rel = theme_rels[0]
-                    theme_part = master_part.related_part(theme_rel.rId)
-                    
-                    # Parse the theme XML
-                    theme_element = ElementTree.fromstring(theme_part.blob)
-                    
-                    # Extract font scheme
-                    ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                    font_scheme_elem = theme_element.find('.//a:fontScheme', ns)
-                    
-                    if font_scheme_elem is not None:
-                        # Get font scheme name
-                        scheme_name = font_scheme_elem.get('name', 'Unknown')
-                        
-                        # Get major font element
-                        major_font_elem = font_scheme_elem.find('.//a:majorFont', ns)
-                        major_fonts = {}
-                        
-                        if major_font_elem is not None:
-                            latin = major_font_elem.find('.//a:latin', ns)
-                            ea = major_font_elem.find('.//a:ea', ns)
-                            cs = major_font_elem.find('.//a:cs', ns)
-                            sym = major_font_elem.find('.//a:sym', ns)
-                            
-                            major_fonts = {
-                                "latin": latin.get('typeface') if latin is not None else None,
-                                "east_asian": ea.get('typeface') if ea is not None else None,
-                                "complex_script": cs.get('typeface') if cs is not None else None,
-                                "symbol": sym.get('typeface') if sym is not None else None
-                            }
-                        
-                        # Get minor font element
-                        minor_font_elem = font_scheme_elem.find('.//a:minorFont', ns)
-                        minor_fonts = {}
-                        
-                        if minor_font_elem is not None:
-                            latin = minor_font_elem.find('.//a:latin', ns)
-                            ea = minor_font_elem.find('.//a:ea', ns)
-                            cs = minor_font_elem.find('.//a:cs', ns)
-                            sym = minor_font_elem.find('.//a:sym', ns)
-                            
-                            minor_fonts = {
-                                "latin": latin.get('typeface') if latin is not None else None,
-                                "east_asian": ea.get('typeface') if ea is not None else None,
-                                "complex_script": cs.get('typeface') if cs is not None else None,
-                                "symbol": sym.get('typeface') if sym is not None else None
-                            }
-                        
-                        theme_fonts = {
-                            "scheme_name": scheme_name,
-                            "major_fonts": major_fonts,
-                            "minor_fonts": minor_fonts
-                        }
-            except Exception as e:
-                theme_fonts["error"] = str(e)
+        if theme_blob is not None:
+            theme_fonts = parse_theme_fonts(theme_blob)
     except Exception as e:
         theme_fonts["error"] = str(e)
     
@@ -239,51 +473,42 @@ def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
 
 def resolve_theme_font(theme_fonts: Dict[str, Any], theme_code: str) -> Optional[str]:
     """Resolve theme font codes to actual font names."""
-    if not theme_code or not theme_code.startswith('+'):
+    slot = THEME_CODE_SLOTS.get(theme_code)
+    if slot is None:
         return None
         
-    try:
-        if theme_code == "+mj-lt":  # Major font, latin
-            return theme_fonts.get("major_fonts", {}).get("latin")
-        elif theme_code == "+mn-lt":  # Minor font, latin
-            return theme_fonts.get("minor_fonts", {}).get("latin")
-        elif theme_code == "+mj-ea":  # Major font, east asian
-            return theme_fonts.get("major_fonts", {}).get("east_asian")
-        elif theme_code == "+mn-ea":  # Minor font, east asian
-            return theme_fonts.get("minor_fonts", {}).get("east_asian")
-        elif theme_code == "+mj-cs":  # Major font, complex script
-            return theme_fonts.get("major_fonts", {}).get("complex_script")
-        elif theme_code == "+mn-cs":  # Minor font, complex script
-            return theme_fonts.get("minor_fonts", {}).get("complex_script")
-        elif theme_code == "+mj-sym":  # Major font, symbol
-            return theme_fonts.get("major_fonts", {}).get("symbol")
-        elif theme_code == "+mn-sym":  # Minor font, symbol
-            return theme_fonts.get("minor_fonts", {}).get("symbol")
-    except Exception:
-        pass
-        
-    return None
+    font_group, script = slot
+    return theme_fonts.get(font_group, {}).get(script)
+
+def resolve_theme_fonts(theme_fonts: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """Resolve every theme font code up front, so runs only need a dict lookup."""
+    return {theme_code: resolve_theme_font(theme_fonts, theme_code) for theme_code in THEME_CODE_SLOTS}
 
-def analyze_paragraph_fonts(paragraph: _Paragraph, theme_fonts: Dict[str, Any]) -> Tuple[Set[str], Dict[str, str]]:
-    """Extract fonts from a paragraph, including runs and theme fonts."""
+def analyze_paragraph_fonts(paragraph: _Paragraph, resolved_fonts: Dict[str, Optional[str]]) -> Tuple[Set[str], Dict[str, str]]:
+    """
+    Extract fonts from a paragraph, including runs and theme fonts.
+    
+    Args:
+        paragraph: Paragraph to analyze
+        resolved_fonts: Theme font codes mapped to font names, from resolve_theme_fonts
+    """
     fonts = set()
     theme_font_usage = {}
 
     for run in paragraph.runs:
         try:
-            if hasattr(run, 'font') and run.font.name:
-                font_name = run.font.name
-                
+            # run.font builds a new Font proxy on every access, so read the name once
+            font_name = run.font.name
+            if font_name:
                 # Check if it's a theme font
                 if font_name.startswith('+'):
                     theme_type = THEME_FONT_CODES.get(font_name, font_name)
-                    resolved_font = resolve_theme_font(theme_fonts, font_name)
+                    resolved_font = resolved_fonts.get(font_name)
                     
+                    # Codes the theme doesn't define are left out rather than recorded with a sentinel
                     if resolved_font:
                         theme_font_usage[theme_type] = resolved_font
                         fonts.add(resolved_font)
-                    else:
-                        theme_font_usage[theme_type] = "MISSING"
                 elif not is_internal_font(font_name):
                     fonts.add(font_name)
 
@@ -292,25 +517,26 @@ def analyze_paragraph_fonts(paragraph: _Paragraph, theme_fonts: Dict[str, Any])
 
     return fonts, theme_font_usage
 
-def analyze_shape_fonts(shape: BaseShape, theme_fonts: Dict[str, Any]) -> Tuple[Set[str], Dict[str, str]]:
+def analyze_shape_fonts(shape: BaseShape, resolved_fonts: Dict[str, Optional[str]]) -> Tuple[Set[str], Dict[str, str]]:
     """Safely extract fonts from a shape, including theme fonts."""
     fonts = set()
     theme_font_usage = {}
     
     try:
-        # Handle text frames
-        if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+        # has_text_frame and has_table are plain properties on every BaseShape,
+        # and a shape is never both, so check the common text frame case first
+        if shape.has_text_frame:
             for paragraph in shape.text_frame.paragraphs:
-                para_fonts, para_theme_fonts = analyze_paragraph_fonts(paragraph, theme_fonts)
+                para_fonts, para_theme_fonts = analyze_paragraph_fonts(paragraph, resolved_fonts)
                 fonts.update(para_fonts)
                 theme_font_usage.update(para_theme_fonts)
                 
         # Handle tables
-        if hasattr(shape, 'has_table') and shape.has_table:
+        elif shape.has_table:
             for row in shape.table.rows:
                 for cell in row.cells:
                     for paragraph in cell.text_frame.paragraphs:
-                        para_fonts, para_theme_fonts = analyze_paragraph_fonts(paragraph, theme_fonts)
+                        para_fonts, para_theme_fonts = analyze_paragraph_fonts(paragraph, resolved_fonts)
                         fonts.update(para_fonts)
                         theme_font_usage.update(para_theme_fonts)
                         
@@ -319,100 +545,258 @@ def analyze_shape_fonts(shape: BaseShape, theme_fonts: Dict[str, Any]) -> Tuple[
         
     return fonts, theme_font_usage
 
-def analyze_fonts(pptx_path: str) -> Tuple[Dict[int, Dict[str, Set[str]]], Set[str]]:
+def find_slide_fonts(sld: Any, slide_num: int) -> Dict[str, Set[str]]:
     """
-    Analyze fonts used in a PowerPoint presentation.
+    Collect the fonts used by each shape on a slide, read straight from its <p:sld> element.
+    
+    Returns:
+        Dictionary mapping shape descriptions to the fonts they use
     """
-    prs = Presentation(pptx_path)
-    font_usage = defaultdict(lambda: defaultdict(set))
-    all_fonts = set()
+    slide_fonts: Dict[str, Set[str]] = {}
     
-    for slide_num, slide in enumerate(prs.slides, start=1):
+    for shape_elem in _XP_TEXT_SHAPES(sld):
         try:
-            for shape in slide.shapes:
-                try:
-                    shape_type = f"Text Shape: {shape.name}" if hasattr(shape, 'name') else "Shape"
-                    fonts = set()
-                    
-                    # Handle text frames
-                    if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                try:
-                                    if hasattr(run, 'font') and run.font.name:
-                                        font_name = run.font.name
-                                        if not is_internal_font(font_name):
-                                            fonts.add(font_name)
-                                except Exception as e:
-                                    logger.debug(f"Error analyzing run: {str(e)}")
-                    
-                    # Handle tables
-                    if hasattr(shape, 'has_table') and shape.has_table:
-                        for row in shape.table.rows:
-                            for cell in row.cells:
-                                for paragraph in cell.text_frame.paragraphs:
-                                    for run in paragraph.runs:
-                                        try:
-                                            if hasattr(run, 'font') and run.font.name:
-                                                font_name = run.font.name
-                                                if not is_internal_font(font_name):
-                                                    fonts.add(font_name)
-                                        except Exception as e:
-                                            logger.debug(f"Error analyzing run: {str(e)}")
-                    
-                    if fonts:
-                        font_usage[slide_num][shape_type].update(fonts)
-                        all_fonts.update(fonts)
-                        
-                except Exception as e:
-                    logger.debug(f"Error processing shape in slide {slide_num}: {str(e)}")
-                    continue
-                    
+            fonts = {font_name for font_name in _XP_TYPEFACES(shape_elem)
+                     if not is_internal_font(font_name)}
+            
+            if fonts:
+                slide_fonts.setdefault(f"Text Shape: {_XP_SHAPE_NAME(shape_elem)}", set()).update(fonts)
+                
         except Exception as e:
-            logger.warning(f"Error processing slide {slide_num}: {str(e)}")
+            logger.debug(f"Error processing shape in slide {slide_num}: {str(e)}")
             continue
+            
+    return slide_fonts
 
-    return font_usage, all_fonts
+def analyze_slide_fonts(slide: Any, slide_num: int, resolved_fonts: Dict[str, Optional[str]]) -> Dict[str, Set[str]]:
+    """
+    Collect the fonts used by each shape on a slide by walking its runs through python-pptx.
+    
+    Slower than find_slide_fonts, but theme font references are resolved
+    through resolved_fonts.
+    
+    Returns:
+        Dictionary mapping shape descriptions to the fonts they use
+    """
+    slide_fonts: Dict[str, Set[str]] = {}
+    
+    for shape in slide.shapes:
+        # Pictures, connectors and groups never have a text frame or table of their own
+        if shape._element.tag not in TEXT_SHAPE_TAGS:
+            continue
+            
+        try:
+            shape_type = f"Text Shape: {shape.name}"
+            fonts, _ = analyze_shape_fonts(shape, resolved_fonts)
+            
+            if fonts:
+                slide_fonts.setdefault(shape_type, set()).update(fonts)
+                
+        except Exception as e:
+            logger.debug(f"Error processing shape in slide {slide_num}: {str(e)}")
+            continue
+            
+    return slide_fonts
 
-def is_internal_font(font_name: str) -> bool:
-    if not font_name:
-        return True
-    font_name = font_name.lower()
-    return any(font_name.startswith(marker.lower()) for marker in INTERNAL_FONT_MARKERS)
-
-def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]], 
-                     all_fonts: Set[str],
-                     system_fonts: Set[str],
-                     presentation: Any):
-    """Print a formatted report showing font usage and theme fonts."""
-    # Filter out internal fonts
-    all_fonts = {s.strip() for s in all_fonts}
-    all_fonts = {f for f in all_fonts if not is_internal_font(f)}
-    
-    system_fonts = {s.lower().strip() for s in system_fonts}
-    
-    # Create a mapping of fonts to the slides that use them
-    font_to_slides: Dict[str, Set[int]] = {}
-    for slide_num, shapes in font_usage.items():
-        # Combine all fonts from all shapes in this slide
+def analyze_fonts(presentation: Union[str, Path, Any], deep: bool = False,
+                  theme_fonts: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, List[int]], Dict[int, Set[str]]]:
+    """
+    Analyze fonts used in a PowerPoint presentation.
+    
+    With deep set, runs are walked through python-pptx and theme fonts are
+    resolved, against theme_fonts if the caller has already extracted them.
+    
+    Returns:
+        Tuple containing:
+        - Dictionary mapping each font to the slides that use it, in slide order
+        - Dictionary mapping slide numbers to the fonts used on them
+    """
+    if deep:
+        presentation = load_presentation(presentation)
+        if theme_fonts is None:
+            theme_fonts = extract_theme_fonts(presentation)
+        resolved_fonts = resolve_theme_fonts(theme_fonts)
+        slide_results = ((slide_num, analyze_slide_fonts(slide, slide_num, resolved_fonts))
+                         for slide_num, slide in enumerate(presentation.slides, start=1))
+    else:
+        slide_results = map_slides(presentation, lambda slide_num, sld: (slide_num, find_slide_fonts(sld, slide_num)))
+        
+    font_to_slides: Dict[str, List[int]] = {}
+    slide_to_fonts: Dict[int, Set[str]] = {}
+    
+    for slide_num, shape_fonts in slide_results:
         slide_fonts = set()
-        for shape_fonts in shapes.values():
-            slide_fonts.update(shape_fonts)
+        for fonts in shape_fonts.values():
+            slide_fonts.update(fonts)
+            
+        for font in slide_fonts:
+            font_to_slides.setdefault(font, []).append(slide_num)
+        if slide_fonts:
+            slide_to_fonts[slide_num] = slide_fonts
+
+    return font_to_slides, slide_to_fonts
+
+def scan_slide(slide_num: int, sld: Any, slide: Any = None,
+               resolved_fonts: Optional[Dict[str, Optional[str]]] = None) -> Tuple[int, bool, bool, bool, Dict[str, Set[str]]]:
+    """
+    Gather everything the reports need from a single slide.
+    
+    Args:
+        slide_num: Slide number, used for logging
+        sld: The slide's <p:sld> element
+        slide: python-pptx slide, given to walk font runs and resolve theme fonts
+        resolved_fonts: Theme font codes mapped to font names, used with slide
+        
+    Returns:
+        Tuple of (slide number, hidden, has transition, has animation, shape fonts)
+    """
+    # An attribute read and two XPath checks on an already parsed element, which cannot fail
+    hidden = is_slide_hidden(sld)
+    has_transition, has_animation = find_slide_effects(sld)
+    
+    slide_fonts: Dict[str, Set[str]] = {}
+    try:
+        if slide is not None:
+            slide_fonts = analyze_slide_fonts(slide, slide_num, resolved_fonts)
+        else:
+            slide_fonts = find_slide_fonts(sld, slide_num)
+    except Exception as e:
+        logger.warning(f"Error processing slide {slide_num}: {str(e)}")
+        
+    return slide_num, hidden, has_transition, has_animation, slide_fonts
+
+def _scan_slide_part(scan: Callable[[int, Any], Any], slide_num: int, data: bytes) -> Any:
+    # Parsers are not shared between threads, so each part gets its own
+    sld = etree.fromstring(data, etree.XMLParser(resolve_entities=False))
+    return scan(slide_num, sld)
+
+def _iter_slide_parts(pptx_path: Union[str, Path, zipfile.ZipFile]) -> Iterator[Tuple[int, bytes]]:
+    with open_package(pptx_path) as zf:
+        for slide_num, part_name in enumerate(read_slide_part_names(zf), start=1):
+            yield slide_num, zf.read(part_name)
+
+def map_slides(presentation: Union[str, Path, Any], scan: Callable[[int, Any], Any]) -> Iterator[Any]:
+    """
+    Call scan(slide number, <p:sld> element) for every slide and yield the results in slide order.
+    
+    Slides are handed to a thread pool SCAN_CHUNK_SIZE at a time, since lxml
+    releases the GIL while parsing. With SCAN_WORKERS set to 1 they are
+    scanned one at a time on the calling thread instead.
+    """
+    if isinstance(presentation, PACKAGE_SOURCES):
+        tasks = ((_scan_slide_part, scan, slide_num, data) for slide_num, data in _iter_slide_parts(presentation))
+    else:
+        tasks = ((scan, slide_num, slide._element)
+                 for slide_num, slide in enumerate(presentation.slides, start=1))
+    
+    if SCAN_WORKERS <= 1:
+        for func, *args in tasks:
+            yield func(*args)
+        return
+    
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        while chunk := list(itertools.islice(tasks, SCAN_CHUNK_SIZE)):
+            futures = [executor.submit(*task) for task in chunk]
+            for future in futures:
+                yield future.result()
+
+def scan_presentation(presentation: Union[str, Path, Any], deep: bool = False,
+                      theme_fonts: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[int, bool, bool, bool, Dict[str, Set[str]]]]:
+    """
+    Walk the slides once, gathering everything the reports need from each slide.
+    
+    Slides are scanned on a thread pool (see map_slides). With deep set, font
+    runs are walked through python-pptx and theme fonts are resolved, one slide at a time,
+    against theme_fonts if the caller has already extracted them.
+    
+    Yields:
+        Tuple for each slide, in slide order, containing:
+        - Slide number
+        - Whether the slide is hidden
+        - Whether the slide has a transition
+        - Whether the slide has animations
+        - Dictionary mapping shape descriptions to the fonts they use
+    """
+    if deep:
+        prs = load_presentation(presentation)
+        if theme_fonts is None:
+            theme_fonts = extract_theme_fonts(prs)
+        resolved_fonts = resolve_theme_fonts(theme_fonts)
+        for slide_num, slide in enumerate(prs.slides, start=1):
+            yield scan_slide(slide_num, slide._element, slide, resolved_fonts)
+        return
+    
+    yield from map_slides(presentation, scan_slide)
+
+def analyze_presentation(presentation: Union[str, Path, Any], deep: bool = False,
+                         theme_fonts: Optional[Dict[str, Any]] = None) -> Tuple[List[int], List[int], List[int], Dict[str, List[int]], Dict[int, Set[str]]]:
+    """
+    Gather hidden slides, effects and font usage in a single pass over the slides.
+    
+    Returns:
+        Tuple containing:
+        - List of hidden slide numbers
+        - List of slide numbers with transitions, in slide order
+        - List of slide numbers with animations, in slide order
+        - Dictionary mapping each font to the slides that use it, in slide order
+        - Dictionary mapping slide numbers to the fonts used on them
+    """
+    hidden_slides = []
+    slides_with_transitions = []
+    slides_with_animations = []
+    font_to_slides: Dict[str, List[int]] = {}
+    slide_to_fonts: Dict[int, Set[str]] = {}
+    
+    for slide_num, hidden, has_transition, has_animation, shape_fonts in scan_presentation(presentation, deep, theme_fonts):
+        if hidden:
+            hidden_slides.append(slide_num)
+        if has_transition:
+            slides_with_transitions.append(slide_num)
+        if has_animation:
+            slides_with_animations.append(slide_num)
             
-        # Add this slide number to each font's list
+        slide_fonts = set()
+        for fonts in shape_fonts.values():
+            slide_fonts.update(fonts)
         for font in slide_fonts:
-            if font and not is_internal_font(font):
-                if font not in font_to_slides:
-                    font_to_slides[font] = set()
-                font_to_slides[font].add(slide_num)
-
-    console = Console(theme=Theme({
-        "missing": "red",
-        "ok": "green",
-        "heading": "bold blue",
-        "theme": "bold magenta"
-    }))
+            font_to_slides.setdefault(font, []).append(slide_num)
+        if slide_fonts:
+            slide_to_fonts[slide_num] = slide_fonts
+            
+    return hidden_slides, slides_with_transitions, slides_with_animations, font_to_slides, slide_to_fonts
+
+@functools.lru_cache(maxsize=1024)
+def is_internal_font(font_name: str) -> bool:
+    if not font_name:
+        return True
+    # Most names can be ruled out on their first character without lowercasing
+    if font_name[0] not in _INTERNAL_FONT_FIRST_CHARS:
+        return False
+    return font_name.lower().startswith(_INTERNAL_FONT_PREFIXES)
+
+@functools.lru_cache(maxsize=4096)
+def canonical_font_name(font_name: str) -> str:
+    """
+    Normalize a font name for case-insensitive comparison.
+    
+    Results are cached and interned, so a deck that repeats the same few fonts
+    only pays for the normalization once per name.
+    """
+    return sys.intern(font_name.strip().lower())
+
+def print_font_report(font_to_slides: Dict[str, List[int]],
+                     system_fonts: FrozenSet[str],
+                     theme_fonts: Dict[str, Any]):
+    """
+    Print a formatted report showing font usage and theme fonts.
     
+    Args:
+        font_to_slides: Dictionary mapping each font to the slides that use it, in slide order
+        system_fonts: Canonical installed font names, as returned by get_system_fonts
+        theme_fonts: Theme fonts, as returned by extract_theme_fonts
+    """
+    missing = {font for font in font_to_slides if canonical_font_name(font) not in system_fonts}
+
     # Print regular font usage
     console.print("\n[heading]=== Regular Font Usage ===\n")
     
@@ -422,13 +806,13 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
         table.add_column("Status")
         table.add_column("Used on Slides")
         
-        for font in sorted(font_to_slides.keys()):
-            if font:  # Skip None values
-                status = "[ok]Installed[/ok]" if font.lower() in system_fonts else "[missing]Missing[/missing]"
-                # Convert slide numbers to a readable string
-                slides = sorted(font_to_slides[font])
-                slides_str = ", ".join(str(slide) for slide in slides)
-                table.add_row(font, status, slides_str)
+        rows = [
+            (font, STATUS_MISSING if font in missing else STATUS_INSTALLED,
+             ", ".join(map(str, font_to_slides[font])))
+            for font in sorted(font_to_slides) if font  # Skip None values
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
     else:
@@ -437,8 +821,10 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
     # Print theme fonts
     console.print("\n[heading]=== Theme Fonts ===\n")
     
-    # Extract theme fonts
-    theme_fonts = extract_theme_fonts(presentation)
+    theme_missing = {
+        font for fonts in (theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {}))
+        for font in fonts.values() if font and canonical_font_name(font) not in system_fonts
+    }
     
     if "error" in theme_fonts:
         console.print(f"[missing]Error accessing theme fonts: {theme_fonts['error']}[/missing]")
@@ -452,7 +838,7 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
         major_fonts = theme_fonts.get("major_fonts", {})
         for script, font in major_fonts.items():
             if font:
-                status = "[ok]Installed[/ok]" if font.lower() in system_fonts else "[missing]Missing[/missing]"
+                status = STATUS_MISSING if font in theme_missing else STATUS_INSTALLED
                 theme_table.add_row(
                     f"[theme]Major {script.replace('_', ' ').title()}[/theme]",
                     font,
@@ -463,7 +849,7 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
         minor_fonts = theme_fonts.get("minor_fonts", {})
         for script, font in minor_fonts.items():
             if font:
-                status = "[ok]Installed[/ok]" if font.lower() in system_fonts else "[missing]Missing[/missing]"
+                status = STATUS_MISSING if font in theme_missing else STATUS_INSTALLED
                 theme_table.add_row(
                     f"[theme]Minor {script.replace('_', ' ').title()}[/theme]",
                     font,
@@ -478,16 +864,14 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
     
     # Print summary statistics
     total_fonts = len(font_to_slides)
-    missing_fonts = sum(1 for font in font_to_slides if font.lower() not in system_fonts)
+    missing_fonts = len(missing)
     
-    total_theme_fonts = sum(
-        len([f for f in fonts.values() if f]) 
-        for fonts in [theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})]
-    )
-    missing_theme_fonts = sum(
-        len([f for f in fonts.values() if f and f.lower() not in system_fonts])
-        for fonts in [theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})]
-    )
+    total_theme_fonts = missing_theme_fonts = 0
+    for fonts in (theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})):
+        for font in fonts.values():
+            if font:
+                total_theme_fonts += 1
+                missing_theme_fonts += font in theme_missing
     
     console.print("\n[bold]Summary:[/bold]")
     console.print(f"Total regular fonts: {total_fonts}")
@@ -495,39 +879,153 @@ def print_font_report(font_usage: Dict[int, Dict[str, Set[str]]],
     console.print(f"Total theme fonts: {total_theme_fonts}")
     console.print(f"Missing theme fonts: {missing_theme_fonts}")
 
-def generate_font_report(pptx_path: str):
+def generate_font_report(presentation: Union[str, Path, Any]):
     # Get system fonts
     system_fonts = get_system_fonts()
     
-    # Open presentation
-    prs = Presentation(pptx_path)
-    
     # Analyze presentation
-    font_usage, all_fonts = analyze_fonts(pptx_path)
+    font_to_slides, _ = analyze_fonts(presentation)
     
     # Print report
-    print_font_report(font_usage, all_fonts, system_fonts, prs)
+    print_font_report(font_to_slides, system_fonts, extract_theme_fonts(presentation))
+
+def collect_shape_geometry(presentation: Union[str, Path, Any]) -> np.ndarray:
+    """
+    Collect the position and size of every top level shape in one pass.
+    
+    Shapes that inherit their placement from the slide layout have no
+    geometry of their own and are skipped.
+    
+    Returns:
+        An (N, 4) int64 array of left, top, width and height in EMU
+    """
+    rows: List[Tuple[int, int, int, int]] = []
+    
+    for slide_num, sld in iter_slide_elements(presentation):
+        try:
+            for xfrm in _XP_SHAPE_XFRMS(sld):
+                off = xfrm.find(A_OFF_TAG)
+                ext = xfrm.find(A_EXT_TAG)
+                if off is not None and ext is not None:
+                    rows.append((int(off.get('x')), int(off.get('y')),
+                                 int(ext.get('cx')), int(ext.get('cy'))))
+        except Exception as e:
+            logger.debug(f"Error reading shape geometry in slide {slide_num}: {str(e)}")
+            continue
+    
+    return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+def _geometry_stats_loop(geom):
+    """Column minimums, maximums and means, with the rows split across threads."""
+    n = geom.shape[0]
+    chunks = min(n, GEOMETRY_STATS_CHUNKS)
+    part_mins = np.empty((chunks, 4), dtype=geom.dtype)
+    part_maxs = np.empty((chunks, 4), dtype=geom.dtype)
+    part_sums = np.zeros((chunks, 4))
+    for chunk in prange(chunks):
+        start = chunk * n // chunks
+        stop = (chunk + 1) * n // chunks
+        for col in range(4):
+            part_mins[chunk, col] = geom[start, col]
+            part_maxs[chunk, col] = geom[start, col]
+        for row in range(start, stop):
+            for col in range(4):
+                value = geom[row, col]
+                if value < part_mins[chunk, col]:
+                    part_mins[chunk, col] = value
+                if value > part_maxs[chunk, col]:
+                    part_maxs[chunk, col] = value
+                part_sums[chunk, col] += value
+    mins = part_mins[0].copy()
+    maxs = part_maxs[0].copy()
+    sums = np.zeros(4)
+    for chunk in range(chunks):
+        for col in range(4):
+            if part_mins[chunk, col] < mins[col]:
+                mins[col] = part_mins[chunk, col]
+            if part_maxs[chunk, col] > maxs[col]:
+                maxs[col] = part_maxs[chunk, col]
+            sums[col] += part_sums[chunk, col]
+    return mins, maxs, sums / n
+
+_geometry_stats_kernel = njit(cache=True, parallel=True)(_geometry_stats_loop) if njit else None
+
+def geometry_stats(geom: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the minimum, maximum and mean of each geometry column.
+    
+    Uses the numba kernel when numba is installed, and NumPy otherwise.
+    
+    Args:
+        geom: Non-empty (N, 4) int64 array from collect_shape_geometry
+        
+    Returns:
+        Tuple of (mins, maxs, means), one entry per column
+    """
+    if _geometry_stats_kernel is not None:
+        return _geometry_stats_kernel(geom)
+    return geom.min(axis=0), geom.max(axis=0), geom.mean(axis=0)
+
+def print_geometry_report(geom: np.ndarray):
+    """Print summary statistics of shape positions and sizes, in inches."""
+    console.print("\n[heading]=== Shape Geometry ===\n")
+    
+    if not len(geom):
+        console.print("(no positioned shapes found)")
+        return
+    
+    mins, maxs, means = geometry_stats(geom)
+    
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Statistic")
+    for column in GEOMETRY_COLUMNS:
+        table.add_column(f"{column} (in)", justify="right")
+    
+    for label, values in (("Min", mins), ("Max", maxs), ("Mean", means)):
+        table.add_row(label, *(f"{value / EMU_PER_INCH:.2f}" for value in values))
+    
+    console.print(f"Shapes measured: {len(geom)}")
+    console.print(table)
 
 def main():
+    global SCAN_WORKERS
+    
     parser = argparse.ArgumentParser(description='Provide information about a PowerPoint presentation')
     parser.add_argument('pptx_file', type=str, help='Path to the PowerPoint file')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--deep', action='store_true', help='Walk every text run and resolve theme fonts (slower)')
+    parser.add_argument('--stats', action='store_true', help='Summarize shape positions and sizes')
+    parser.add_argument('--workers', type=int, default=SCAN_WORKERS,
+                        help=f'Threads used to scan slides, 1 to disable threading (default: {SCAN_WORKERS})')
     args = parser.parse_args()
     
     if args.debug:
         logger.setLevel(logging.DEBUG)
     
+    SCAN_WORKERS = args.workers
+    
     pptx_path = Path(args.pptx_file)
     if not pptx_path.exists():
         logger.error(f"Error: File '{pptx_path}' not found")
         return
     
     try:
-        generate_hidden_slides_report(pptx_path)
+        # Only the deep font walk needs python-pptx; otherwise the package is
+        # opened once and every report reads its parts straight from it
+        opened = contextlib.nullcontext(Presentation(pptx_path)) if args.deep else zipfile.ZipFile(pptx_path)
+        with opened as source:
+            # Read once, for both the deep font walk and the theme report
+            theme_fonts = extract_theme_fonts(source)
+            hidden_slides, transitions, animations, font_to_slides, _ = analyze_presentation(source, args.deep, theme_fonts)
+
+            print_hidden_slides_report(hidden_slides)
 
-        generate_effects_report(pptx_path)
+            print_effects_report(transitions, animations)
+                
+            print_font_report(font_to_slides, get_system_fonts(), theme_fonts)
             
-        generate_font_report(pptx_path)
+            if args.stats:
+                print_geometry_report(collect_shape_geometry(source))
         
     except Exception as e:
         logger.error(f"Error analyzing presentation: {e}")
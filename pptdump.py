@@ -1,310 +1,532 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
+#     "lxml",
+#     "numpy",
+#     "orjson",
 #     "python-pptx",
 # ]
 # ///
 
 
-import json
+import copy
+import functools
+import io
+import os
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from pptx import Presentation
-from typing import Any, Dict, List
-from xml.etree import ElementTree
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.shapes.picture import Picture
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from lxml import etree
+import numpy as np
+import orjson
 
+# numba is optional; without it the table statistics fall back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
 
-def resolve_theme_font(shape: Any, theme_code: str) -> str:
-    """Resolve theme font codes to actual font names."""
+NS_P = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+NS_A = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+
+# Slide-level elements collected by scan_slide_parts
+P_BG_TAG = sys.intern(f"{{{NS_P['p']}}}bg")
+P_TRANSITION_TAG = sys.intern(f"{{{NS_P['p']}}}transition")
+P_TIMING_TAG = sys.intern(f"{{{NS_P['p']}}}timing")
+SLIDE_PART_TAGS = (P_BG_TAG, P_TRANSITION_TAG, P_TIMING_TAG)
+P_CSLD_TAG = sys.intern(f"{{{NS_P['p']}}}cSld")
+MC_ALTERNATE_CONTENT_TAG = sys.intern(
+    "{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent")
+
+NS_PA = {**NS_P, **NS_A}
+
+# XPath expressions, compiled once. Each follows the element's position in
+# the ECMA-376 schema with child steps instead of searching all descendants.
+# Latin font of the first paragraph properties in a shape
+_XP_SHAPE_LATIN = etree.XPath('(p:txBody/a:p/a:pPr)[1]/a:defRPr/a:latin', namespaces=NS_PA)
+
+# Text properties looked up for every text shape (p:sp)
+_XP_BODY_PR = etree.XPath('p:txBody/a:bodyPr', namespaces=NS_PA)
+_XP_DEFAULT_PPR = etree.XPath('p:txBody/a:lstStyle/a:defPPr', namespaces=NS_PA)
+_XP_DEFAULT_RPR = etree.XPath('p:txBody/a:lstStyle/a:defPPr/a:defRPr', namespaces=NS_PA)
+
+# Theme font collections, relative to a:fontScheme and its font collections
+_XP_MAJOR_FONT = etree.XPath('a:majorFont', namespaces=NS_A)
+_XP_MINOR_FONT = etree.XPath('a:minorFont', namespaces=NS_A)
+_XP_LATIN = etree.XPath('a:latin', namespaces=NS_A)
+_XP_EA = etree.XPath('a:ea', namespaces=NS_A)
+_XP_CS = etree.XPath('a:cs', namespaces=NS_A)
+_XP_SYM = etree.XPath('a:sym', namespaces=NS_A)
+
+# Slide master text styles, relative to p:sldMaster and its text list styles
+_XP_TX_STYLES = etree.XPath('p:txStyles', namespaces=NS_P)
+_XP_TITLE_STYLE = etree.XPath('p:titleStyle', namespaces=NS_P)
+_XP_BODY_STYLE = etree.XPath('p:bodyStyle', namespaces=NS_P)
+_XP_OTHER_STYLE = etree.XPath('p:otherStyle', namespaces=NS_P)
+
+# Clark-notation tags for direct-child lookups and tag dispatch
+A_PPR_TAG = sys.intern(f"{{{NS_A['a']}}}pPr")
+A_RPR_TAG = sys.intern(f"{{{NS_A['a']}}}rPr")
+A_DEF_PPR_TAG = sys.intern(f"{{{NS_A['a']}}}defPPr")
+A_DEF_RPR_TAG = sys.intern(f"{{{NS_A['a']}}}defRPr")
+A_LATIN_TAG = sys.intern(f"{{{NS_A['a']}}}latin")
+A_EA_TAG = sys.intern(f"{{{NS_A['a']}}}ea")
+A_CS_TAG = sys.intern(f"{{{NS_A['a']}}}cs")
+A_FONT_TAG = sys.intern(f"{{{NS_A['a']}}}font")
+A_SYM_TAG = sys.intern(f"{{{NS_A['a']}}}sym")
+A_THEME_ELEMENTS_TAG = sys.intern(f"{{{NS_A['a']}}}themeElements")
+A_FONT_SCHEME_TAG = sys.intern(f"{{{NS_A['a']}}}fontScheme")
+# Outline level paragraph properties lvl1pPr .. lvl9pPr, mapped to their level
+A_LEVEL_PPR_TAGS = {sys.intern(f"{{{NS_A['a']}}}lvl{i}pPr"): i for i in range(1, 10)}
+
+# Slide master text styles reported by extract_master_text_styles
+MASTER_TEXT_STYLES = (
+    ("title_style", _XP_TITLE_STYLE),
+    ("body_style", _XP_BODY_STYLE),
+    ("other_style", _XP_OTHER_STYLE),
+)
+
+# Font collection children reported by extract_font_details, in output order
+DETAILED_FONT_KEYS = {A_LATIN_TAG: "latin", A_EA_TAG: "east_asian", A_CS_TAG: "complex_script"}
+SCRIPT_FONT_TAGS = (A_FONT_TAG, A_CS_TAG, A_EA_TAG, A_SYM_TAG)
+
+
+def _find_first(xpath: etree.XPath, element: Any) -> Any:
+    """Return the first node selected by a compiled XPath, or None."""
+    nodes = xpath(element)
+    return nodes[0] if nodes else None
+
+
+def _enum_name(member: Any) -> Any:
+    """Return a python-pptx enum member's name, or None when the value is unset."""
+    return member.name if member is not None else None
+
+
+def _emu(length: Any) -> Any:
+    """Return a python-pptx Length as a plain int so it pickles and encodes cheaply."""
+    return int(length) if length is not None else None
+
+
+def _leading_child(element: Any, tag: str) -> Any:
+    """Return element's first child if it has the given tag, otherwise None.
+
+    DrawingML puts pPr first in a:p and rPr first in a:r, so checking one tag
+    replaces a search of the children on the many paragraphs and runs that
+    inherit all of their properties.
+    """
+    if len(element) and element[0].tag == tag:
+        return element[0]
+    return None
+
+
+def _script_fonts(run_props: Any) -> Tuple[Any, Any, Any]:
+    """Return the latin, east asian and complex script children of run properties.
+
+    The fonts are always direct children of rPr/defRPr, so this avoids the
+    descendant searches of find('.//a:latin').
+    """
+    if run_props is None:
+        return None, None, None
+    return run_props.find(A_LATIN_TAG), run_props.find(A_EA_TAG), run_props.find(A_CS_TAG)
+
+
+def _typeface(font: Any) -> Optional[str]:
+    """Return a font element's typeface attribute, interned.
+
+    lxml returns a new string for every attribute read, while a deck uses a
+    handful of typefaces and theme codes across all of its runs; interning
+    lets the run dictionaries share one copy of each.
+    """
+    typeface = font.get('typeface')
+    return sys.intern(typeface) if typeface is not None else None
+
+
+# Slides are converted in worker processes once a deck has more than this many
+PARALLEL_SLIDE_THRESHOLD = 4
+SLIDE_WORKERS = os.cpu_count() or 1
+# Converted slides waiting to be written are capped at this many per worker
+SLIDES_IN_FLIGHT_PER_WORKER = 2
+
+# Add per-table text statistics to the output; set by --stats
+TABLE_STATS = False
+# Tables with more cells than this use the numba kernel when it is available
+TABLE_STATS_JIT_THRESHOLD = 1000
+
+# Add the raw XML of the theme font scheme and of each slide's background,
+# transition and timing to the output; set by --xml
+INCLUDE_RAW_XML = False
+
+# Presentation opened once per worker process by _init_slide_worker
+_worker_presentation = None
+
+# Optional shape attributes probed by shape_to_dict, in capability tuple order
+SHAPE_CAPABILITY_ATTRS = ('has_text_frame', 'has_table', 'is_placeholder', '_element')
+
+# Capability tuples keyed by shape class, filled on first use
+_shape_capabilities_cache: Dict[type, Tuple[bool, ...]] = {}
+
+# Theme font codes mapped to (font group, font slot, fallback typeface)
+_THEME_FONT_SLOTS = {
+    "+mj-lt": ("major", _XP_LATIN, "Unknown"),
+    "+mn-lt": ("minor", _XP_LATIN, "Unknown"),
+    "+mj-ea": ("major", _XP_EA, "Unknown"),
+    "+mn-ea": ("minor", _XP_EA, "Unknown"),
+    "+mj-cs": ("major", _XP_CS, "Unknown"),
+    "+mn-cs": ("minor", _XP_CS, "Unknown"),
+    "+mj-sym": ("major", _XP_SYM, "Symbol"),
+    "+mn-sym": ("minor", _XP_SYM, "Symbol"),
+}
+
+
+def _theme_owner_part(shape: Any) -> Any:
+    """Return the part whose relationships point at the theme used by a shape.
+
+    Each python-pptx property on the way is read once; slide_layout in
+    particular goes through the slide's relationships on every access.
+    """
+    part = getattr(shape, 'part', None)
+    slide = getattr(part, 'slide', None)
+    if slide is not None:
+        # For shapes on slides
+        return slide.slide_layout.slide_master.part
+    master = getattr(getattr(shape, 'slide_layout', None), 'slide_master', None)
+    if master is not None:
+        # For slides
+        return master.part
+    if part is not None and hasattr(shape, '_element'):
+        # For slide masters
+        return part
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def theme_part_of(master_part: Any) -> Any:
+    """Return the theme part related to a slide master part, or None."""
+    return next((master_part.related_part(rel.rId) for rel in master_part.rels.values()
+                 if rel.reltype == RT.THEME), None)
+
+
+@functools.lru_cache(maxsize=64)
+def theme_font_scheme(theme_part: Any) -> Any:
+    """Parse a theme part's a:themeElements/a:fontScheme once, or return None.
+
+    Only the font scheme is needed, so the theme is parsed incrementally up to
+    the end of that element and the rest (format scheme, object defaults,
+    extensions) is never built. The scheme is copied into its own document so
+    the partial theme tree is freed; it is shared read-only by all callers.
+    """
+    for _, elem in etree.iterparse(io.BytesIO(theme_part.blob), events=('end',),
+                                   tag=A_FONT_SCHEME_TAG):
+        parent = elem.getparent()
+        if parent is not None and parent.tag == A_THEME_ELEMENTS_TAG:
+            return copy.deepcopy(elem)
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def theme_resolution_map(master_part: Any) -> Tuple[Optional[str], Dict[str, str]]:
+    """Resolve every standard theme font code of one slide master part.
+
+    The theme XML is parsed once per master; later lookups are dict reads.
+
+    Returns:
+        Tuple of (problem, mapping). problem describes why the theme fonts
+        cannot be resolved, or is None; mapping holds the typeface (or its
+        fallback) for each code in _THEME_FONT_SLOTS.
+    """
+    theme_part = theme_part_of(master_part) if master_part is not None else None
+    if theme_part is None:
+        return "no theme found", {}
+
+    # Parse the theme's font scheme
+    font_scheme = theme_font_scheme(theme_part)
+    if font_scheme is None:
+        return "no font scheme found", {}
+
+    # Find major and minor fonts
+    major_font = _find_first(_XP_MAJOR_FONT, font_scheme)
+    minor_font = _find_first(_XP_MINOR_FONT, font_scheme)
+
+    if major_font is None or minor_font is None:
+        return "incomplete font scheme", {}
+
+    mapping = {}
+    for theme_code, (group_name, font_xpath, fallback) in _THEME_FONT_SLOTS.items():
+        group = major_font if group_name == "major" else minor_font
+        font = _find_first(font_xpath, group)
+        mapping[theme_code] = _typeface(font) if font is not None else fallback
+    return None, mapping
+
+
+def theme_context(owner: Any) -> Optional[Tuple[Optional[str], Dict[str, str]]]:
+    """Look up the theme resolution map for a slide, shape or master once.
+
+    Returns None if the lookup fails, so resolve_theme_font falls back to its
+    own lookup and reports the error for each code as before.
+    """
+    try:
+        return theme_resolution_map(_theme_owner_part(owner))
+    except Exception:
+        return None
+
+
+def resolve_theme_font(shape: Any, theme_code: str,
+                       theme: Optional[Tuple[Optional[str], Dict[str, str]]] = None) -> str:
+    """Resolve theme font codes to actual font names.
+
+    Theme codes are looked up in the per-master map from theme_resolution_map,
+    so the theme is only parsed once per slide master rather than for every run.
+    Callers converting many shapes of one slide pass that map as theme (see
+    theme_context) to skip finding the slide master again for every code.
+    """
     try:
         if not theme_code:
             return None
-            
+
         # If it's not a theme code (doesn't start with +), return as is
         if not theme_code.startswith('+'):
             return theme_code
-            
-        # Get access to the theme
-        theme_part = None
-        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-        
-        if hasattr(shape, 'part') and hasattr(shape.part, 'slide'):
-            # For shapes on slides
-            slide_layout = shape.part.slide.slide_layout
-            master = slide_layout.slide_master
-            master_part = master.part  # part is on the SlideMaster object, not on _element
-            theme_rels = [rel for rel in master_part.rels.values() if rel.reltype == RT.THEME]
-            if theme_rels:
-                theme_rel = theme_rels[0]
-                theme_part = master_part.related_part(theme_rel.rId)
-        elif hasattr(shape, 'slide_layout') and hasattr(shape.slide_layout, 'slide_master'):
-            # For slides
-            master = shape.slide_layout.slide_master
-            master_part = master.part  # part is on the SlideMaster object, not on _element
-            theme_rels = [rel for rel in master_part.rels.values() if rel.reltype == RT.THEME]
-            if theme_rels:
-                theme_rel = theme_rels[0]
-                theme_part = master_part.related_part(theme_rel.rId)
-        elif hasattr(shape, '_element') and hasattr(shape, 'part'):
-            # For slide masters
-            master_part = shape.part  # part is on the SlideMaster object, not on _element
-            theme_rels = [rel for rel in master_part.rels.values() if rel.reltype == RT.THEME]
-            if theme_rels:
-                theme_rel = theme_rels[0]
-                theme_part = master_part.related_part(theme_rel.rId)
-        
-        if not theme_part:
-            return f"Unable to resolve theme code: {theme_code} (no theme found)"
-            
-        # Parse the theme XML
-        from xml.etree import ElementTree
-        theme_element = ElementTree.fromstring(theme_part.blob)
-        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-        
-        # Find font scheme
-        font_scheme = theme_element.find('.//a:fontScheme', ns)
-        if not font_scheme:
-            return f"Unable to resolve theme code: {theme_code} (no font scheme found)"
-            
-        # Find major and minor fonts
-        major_font = font_scheme.find('.//a:majorFont', ns)
-        minor_font = font_scheme.find('.//a:minorFont', ns)
-        
-        if not major_font or not minor_font:
-            return f"Unable to resolve theme code: {theme_code} (incomplete font scheme)"
-            
-        # Handle theme codes
-        # Major/Minor Latin fonts
-        if theme_code == "+mj-lt":  # Major font, latin
-            latin = major_font.find('.//a:latin', ns)
-            return latin.get('typeface') if latin is not None else "Unknown"
-        elif theme_code == "+mn-lt":  # Minor font, latin
-            latin = minor_font.find('.//a:latin', ns)
-            return latin.get('typeface') if latin is not None else "Unknown"
-            
-        # Major/Minor East Asian fonts
-        elif theme_code == "+mj-ea":  # Major font, east asian
-            ea = major_font.find('.//a:ea', ns)
-            return ea.get('typeface') if ea is not None else "Unknown"
-        elif theme_code == "+mn-ea":  # Minor font, east asian
-            ea = minor_font.find('.//a:ea', ns)
-            return ea.get('typeface') if ea is not None else "Unknown"
-            
-        # Major/Minor Complex Script fonts
-        elif theme_code == "+mj-cs":  # Major font, complex script
-            cs = major_font.find('.//a:cs', ns)
-            return cs.get('typeface') if cs is not None else "Unknown"
-        elif theme_code == "+mn-cs":  # Minor font, complex script
-            cs = minor_font.find('.//a:cs', ns)
-            return cs.get('typeface') if cs is not None else "Unknown"
-            
-        # Symbol fonts
-        elif theme_code == "+mj-sym":  # Major font, symbol
-            sym = major_font.find('.//a:sym', ns)
-            return sym.get('typeface') if sym is not None else "Symbol"
-        elif theme_code == "+mn-sym":  # Minor font, symbol
-            sym = minor_font.find('.//a:sym', ns)
-            return sym.get('typeface') if sym is not None else "Symbol"
-            
+
+        if theme is None:
+            theme = theme_resolution_map(_theme_owner_part(shape))
+        problem, mapping = theme
+        if problem:
+            return f"Unable to resolve theme code: {theme_code} ({problem})"
+
+        resolved = mapping.get(theme_code)
+        if resolved is not None:
+            return resolved
+
         # Handle other possible theme codes
-        elif theme_code.startswith("+mj-"):  # Other major font variants
+        if theme_code.startswith("+mj-"):  # Other major font variants
             script = theme_code[4:]
             return f"Major font for script '{script}' (unresolved)"
-        elif theme_code.startswith("+mn-"):  # Other minor font variants
+        if theme_code.startswith("+mn-"):  # Other minor font variants
             script = theme_code[4:]
             return f"Minor font for script '{script}' (unresolved)"
-        else:
-            return f"Unknown theme code: {theme_code}"
+        return f"Unknown theme code: {theme_code}"
     except Exception as e:
         return f"Error resolving theme code '{theme_code}': {str(e)}"
 
+def _font_group_typefaces(font_group: Any) -> Dict[str, Optional[str]]:
+    """Return the latin, east asian and complex script typefaces of a font collection."""
+    if font_group is None:
+        return {}
+    latin = _find_first(_XP_LATIN, font_group)
+    ea = _find_first(_XP_EA, font_group)
+    cs = _find_first(_XP_CS, font_group)
+    return {
+        "latin": latin.get('typeface') if latin is not None else None,
+        "east_asian": ea.get('typeface') if ea is not None else None,
+        "complex_script": cs.get('typeface') if cs is not None else None
+    }
+
+def extract_master_text_styles(master: Any, owner: Any,
+                               theme: Optional[Tuple[Optional[str], Dict[str, str]]]) -> Optional[Dict[str, Any]]:
+    """Extract the title, body and other text style fonts of a slide master.
+
+    Theme codes are resolved for owner, the master itself or a slide using it.
+
+    Returns:
+        Dict keyed by style name, or None if the master has no txStyles
+    """
+    text_styles = _find_first(_XP_TX_STYLES, master._element)
+    if text_styles is None:
+        return None
+
+    styles = {}
+    for key, style_xpath in MASTER_TEXT_STYLES:
+        style = _find_first(style_xpath, text_styles)
+        if style is not None:
+            styles[key] = extract_text_style_fonts(style, owner, theme)
+    return styles
+
 def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
     """Extract theme font information from the presentation."""
     theme_fonts = {}
     
-    try:
-        # Get the default theme from the first slide master
-        if presentation.slide_masters and len(presentation.slide_masters) > 0:
-            master = presentation.slide_masters[0]
-            
-            # Access the theme through the part relationships
-            try:
-                # Try to get the theme part through the master's part relationships
-                from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-                
-                # Get the master part - part is on the SlideMaster object, not on _element
-                master_part = master.part
-                
-                # Find theme relationships
-                theme_rels = [rel for rel in master_part.rels.values() 
-                             if rel.reltype == RT.THEME]
-                
-                if theme_rels:
-                    # Get the first theme part using the relationship ID
-                    theme_rel = theme_rels[0]
-                    theme_part = master_part.related_part(theme_rel.rId)
-                    
-                    # Parse the theme XML
-                    from xml.etree import ElementTree
-                    theme_element = ElementTree.fromstring(theme_part.blob)
-                    
-                    # Extract font scheme
-                    ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                    font_scheme_elem = theme_element.find('.//a:fontScheme', ns)
-                    
-                    if font_scheme_elem is not None:
-                        # Get font scheme name
-                        scheme_name = font_scheme_elem.get('name', 'Unknown')
-                        
-                        # Get major font element
-                        major_font_elem = font_scheme_elem.find('.//a:majorFont', ns)
-                        major_fonts = {}
-                        
-                        if major_font_elem is not None:
-                            latin = major_font_elem.find('.//a:latin', ns)
-                            ea = major_font_elem.find('.//a:ea', ns)
-                            cs = major_font_elem.find('.//a:cs', ns)
-                            
-                            major_fonts = {
-                                "latin": latin.get('typeface') if latin is not None else None,
-                                "east_asian": ea.get('typeface') if ea is not None else None,
-                                "complex_script": cs.get('typeface') if cs is not None else None
-                            }
-                            
-                            # Extract detailed font information
-                            major_fonts_details = extract_font_details(major_font_elem, ns)
-                        
-                        # Get minor font element
-                        minor_font_elem = font_scheme_elem.find('.//a:minorFont', ns)
-                        minor_fonts = {}
-                        
-                        if minor_font_elem is not None:
-                            latin = minor_font_elem.find('.//a:latin', ns)
-                            ea = minor_font_elem.find('.//a:ea', ns)
-                            cs = minor_font_elem.find('.//a:cs', ns)
-                            
-                            minor_fonts = {
-                                "latin": latin.get('typeface') if latin is not None else None,
-                                "east_asian": ea.get('typeface') if ea is not None else None,
-                                "complex_script": cs.get('typeface') if cs is not None else None
-                            }
-                            
-                            # Extract detailed font information
-                            minor_fonts_details = extract_font_details(minor_font_elem, ns)
-                        
-                        theme_fonts = {
-                            "scheme_name": scheme_name,
-                            "major_fonts": major_fonts,
-                            "minor_fonts": minor_fonts,
-                            "major_fonts_details": major_fonts_details if 'major_fonts_details' in locals() else {},
-                            "minor_fonts_details": minor_fonts_details if 'minor_fonts_details' in locals() else {}
-                        }
-                        
-                        # Store the XML for reference
-                        theme_fonts["xml"] = ElementTree.tostring(font_scheme_elem).decode()
-                
-                # Extract default text styles from the slide master
-                try:
-                    if hasattr(master, '_element'):
-                        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-                              'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
-                        
-                        # Get text styles from the slide master
-                        text_styles = master._element.find('.//p:txStyles', ns)
-                        if text_styles is not None:
-                            theme_fonts["master_text_styles"] = {}
-                            
-                            # Title style
-                            title_style = text_styles.find('.//p:titleStyle', ns)
-                            if title_style is not None:
-                                theme_fonts["master_text_styles"]["title_style"] = extract_text_style_fonts(title_style, ns, master)
-                            
-                            # Body style
-                            body_style = text_styles.find('.//p:bodyStyle', ns)
-                            if body_style is not None:
-                                theme_fonts["master_text_styles"]["body_style"] = extract_text_style_fonts(body_style, ns, master)
-                            
-                            # Other style
-                            other_style = text_styles.find('.//p:otherStyle', ns)
-                            if other_style is not None:
-                                theme_fonts["master_text_styles"]["other_style"] = extract_text_style_fonts(other_style, ns, master)
-                except Exception as e:
-                    theme_fonts["master_text_styles_error"] = str(e)
-            except Exception as e:
-                theme_fonts["theme_access_error"] = str(e)
-    except Exception as e:
-        theme_fonts["error"] = str(e)
+    # Get the default theme from the first slide master
+    if not len(presentation.slide_masters):
+        return theme_fonts
+    master = presentation.slide_masters[0]
+
+    # Access the theme through the master part's relationships
+    theme_part = theme_part_of(master.part)
+    if theme_part is not None:
+        try:
+            font_scheme_elem = theme_font_scheme(theme_part)
+        except etree.XMLSyntaxError as e:
+            theme_fonts["theme_access_error"] = str(e)
+            return theme_fonts
+
+        if font_scheme_elem is not None:
+            major_font_elem = _find_first(_XP_MAJOR_FONT, font_scheme_elem)
+            minor_font_elem = _find_first(_XP_MINOR_FONT, font_scheme_elem)
+            theme_fonts = {
+                "scheme_name": font_scheme_elem.get('name', 'Unknown'),
+                "major_fonts": _font_group_typefaces(major_font_elem),
+                "minor_fonts": _font_group_typefaces(minor_font_elem),
+                "major_fonts_details": extract_font_details(major_font_elem) if major_font_elem is not None else {},
+                "minor_fonts_details": extract_font_details(minor_font_elem) if minor_font_elem is not None else {},
+            }
+            if INCLUDE_RAW_XML:
+                # Store the XML for reference
+                theme_fonts["xml"] = etree.tostring(font_scheme_elem, encoding="unicode", with_tail=False)
+
+    # Extract default text styles from the slide master
+    master_text_styles = extract_master_text_styles(master, master, theme_context(master))
+    if master_text_styles is not None:
+        theme_fonts["master_text_styles"] = master_text_styles
     
     return theme_fonts
 
-def extract_font_details(font_elem: Any, ns: Dict[str, str]) -> Dict[str, Any]:
-    """Extract detailed font information from a font element."""
+def extract_font_details(font_elem: Any) -> Dict[str, Any]:
+    """Extract detailed font information from a font element.
+
+    The children of the font collection are visited once: the first latin,
+    ea and cs entries give the detailed fonts, and font/cs/ea/sym entries
+    carrying a script give the script fonts, listed in that tag order.
+    """
     font_details = {}
     
-    try:
-        # Extract latin font details
-        latin = font_elem.find('.//a:latin', ns)
-        if latin is not None:
-            font_details["latin"] = {
-                "typeface": latin.get('typeface'),
-                "panose": latin.get('panose'),
-                "pitchFamily": latin.get('pitchFamily'),
-                "charset": latin.get('charset')
-            }
-        
-        # Extract east asian font details
-        ea = font_elem.find('.//a:ea', ns)
-        if ea is not None:
-            font_details["east_asian"] = {
-                "typeface": ea.get('typeface'),
-                "panose": ea.get('panose'),
-                "pitchFamily": ea.get('pitchFamily'),
-                "charset": ea.get('charset')
-            }
-        
-        # Extract complex script font details
-        cs = font_elem.find('.//a:cs', ns)
-        if cs is not None:
-            font_details["complex_script"] = {
-                "typeface": cs.get('typeface'),
-                "panose": cs.get('panose'),
-                "pitchFamily": cs.get('pitchFamily'),
-                "charset": cs.get('charset')
+    detailed = {}
+    script_groups = {tag: [] for tag in SCRIPT_FONT_TAGS}
+    for child in font_elem:
+        tag = child.tag
+        if tag in DETAILED_FONT_KEYS and tag not in detailed:
+            detailed[tag] = child
+        group = script_groups.get(tag)
+        if group is not None:
+            group.append(child)
+
+    # Extract latin, east asian and complex script font details
+    for tag, key in DETAILED_FONT_KEYS.items():
+        font = detailed.get(tag)
+        if font is not None:
+            font_details[key] = {
+                "typeface": font.get('typeface'),
+                "panose": font.get('panose'),
+                "pitchFamily": font.get('pitchFamily'),
+                "charset": font.get('charset')
             }
-        
-        # Extract font for specific scripts
-        for script_tag in ['a:font', 'a:cs', 'a:ea', 'a:sym']:
-            script_fonts = font_elem.findall(f'.//{script_tag}', ns)
-            if script_fonts:
-                if "script_fonts" not in font_details:
-                    font_details["script_fonts"] = []
-                
-                for font in script_fonts:
-                    script = font.get('script')
-                    typeface = font.get('typeface')
-                    if script and typeface:
-                        font_details["script_fonts"].append({
-                            "script": script,
-                            "typeface": typeface
-                        })
-    except Exception as e:
-        font_details["error"] = str(e)
+    
+    # Extract font for specific scripts
+    for script_fonts in script_groups.values():
+        if script_fonts:
+            if "script_fonts" not in font_details:
+                font_details["script_fonts"] = []
+            
+            for font in script_fonts:
+                script = font.get('script')
+                typeface = font.get('typeface')
+                if script and typeface:
+                    font_details["script_fonts"].append({
+                        "script": script,
+                        "typeface": typeface
+                    })
     
     return font_details
 
-def shape_to_dict(shape: Any) -> Dict[str, Any]:
-    """Convert a shape object to a dictionary of its properties."""
+def _table_stats_loop(lengths):
+    """Count the non-empty cells and total characters, with the cells split across threads."""
+    non_empty = 0
+    characters = 0
+    for i in prange(lengths.shape[0]):
+        if lengths[i] > 0:
+            non_empty += 1
+        characters += lengths[i]
+    return non_empty, characters
+
+_table_stats_kernel = njit(cache=True, parallel=True)(_table_stats_loop) if njit else None
+
+def table_text_stats(texts: List[str]) -> Dict[str, int]:
+    """Summarise the cell texts of a table.
+
+    Large tables go through the numba kernel when numba is installed; smaller
+    ones, or all tables without numba, use NumPy.
+
+    Args:
+        texts: Text of every cell, in row-major order
+
+    Returns:
+        Dict with the cell count, non-empty cell count, total characters and
+        length of the longest cell
+    """
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    if not lengths.size:
+        return {"cells": 0, "non_empty_cells": 0, "characters": 0, "longest_cell": 0}
+
+    if _table_stats_kernel is not None and lengths.size > TABLE_STATS_JIT_THRESHOLD:
+        non_empty, characters = _table_stats_kernel(lengths)
+    else:
+        non_empty, characters = np.count_nonzero(lengths), lengths.sum()
+    return {
+        "cells": int(lengths.size),
+        "non_empty_cells": int(non_empty),
+        "characters": int(characters),
+        "longest_cell": int(lengths.max())
+    }
+
+def _resolve_typeface(owner: Any, typeface: Optional[str],
+                      theme: Optional[Tuple[Optional[str], Dict[str, str]]]) -> Optional[str]:
+    """Resolve a typeface, calling resolve_theme_font only for theme codes.
+
+    Most typefaces name a concrete font, which resolves to itself.
+    """
+    if typeface and typeface.startswith('+'):
+        return resolve_theme_font(owner, typeface, theme)
+    return typeface or None
+
+def _font_entry(font: Any, owner: Any,
+                theme: Optional[Tuple[Optional[str], Dict[str, str]]]) -> Dict[str, Optional[str]]:
+    """Describe a latin/ea/cs font element as its typeface and resolved name."""
+    if font is None:
+        return {"typeface": None, "resolved": None}
+    typeface = _typeface(font)
+    return {"typeface": typeface, "resolved": _resolve_typeface(owner, typeface, theme)}
+
+def shape_capabilities(shape: Any) -> Tuple[bool, ...]:
+    """Report which of SHAPE_CAPABILITY_ATTRS a shape provides.
+
+    Whether an attribute exists depends only on the shape's class, so the
+    hasattr probes run once for the first shape of each class.
+    """
+    shape_class = type(shape)
+    capabilities = _shape_capabilities_cache.get(shape_class)
+    if capabilities is None:
+        capabilities = tuple(hasattr(shape, attr) for attr in SHAPE_CAPABILITY_ATTRS)
+        _shape_capabilities_cache[shape_class] = capabilities
+    return capabilities
+
+def shape_to_dict(shape: Any, theme: Optional[Tuple[Optional[str], Dict[str, str]]] = None) -> Dict[str, Any]:
+    """Convert a shape object to a dictionary of its properties.
+
+    theme is the slide's theme_context; it is looked up from the shape when
+    not given.
+    """
     shape_dict = {
         "name": shape.name,
-        "shape_type": str(shape.shape_type),
-        "width": shape.width,
-        "height": shape.height,
-        "left": shape.left,
-        "top": shape.top,
+        "shape_type": _enum_name(shape.shape_type),
+        "width": _emu(shape.width),
+        "height": _emu(shape.height),
+        "left": _emu(shape.left),
+        "top": _emu(shape.top),
     }
 
+    has_text_frame, has_table, has_placeholder, has_element = shape_capabilities(shape)
+
     # Handle text if present
-    if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+    if has_text_frame and shape.has_text_frame:
+        if theme is None:
+            theme = theme_context(shape)
+
         shape_dict["text_frame"] = {
             "text": shape.text,
             "default_font": None,
@@ -314,53 +536,41 @@ def shape_to_dict(shape: Any) -> Dict[str, Any]:
         }
 
         # Try to get shape-level font defaults from XML
-        if hasattr(shape, '_element'):
-            ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+        if has_element:
             
             # Extract default text style from shape properties
-            try:
-                shape_style = shape._element.find('.//a:bodyPr', ns)
-                if shape_style is not None:
-                    shape_dict["text_frame"]["body_properties"] = {
-                        "anchor": shape_style.get('anchor'),
-                        "wrap_text": shape_style.get('wrap'),
-                        "vertical": shape_style.get('vert'),
-                        "rotation": shape_style.get('rot')
-                    }
-            except Exception as e:
-                shape_dict["text_frame"]["body_properties_error"] = str(e)
+            shape_style = _find_first(_XP_BODY_PR, shape._element)
+            if shape_style is not None:
+                shape_dict["text_frame"]["body_properties"] = {
+                    "anchor": shape_style.get('anchor'),
+                    "wrap_text": shape_style.get('wrap'),
+                    "vertical": shape_style.get('vert'),
+                    "rotation": shape_style.get('rot')
+                }
                 
             # Look for default paragraph properties
-            try:
-                default_style = shape._element.find('.//a:lstStyle/a:defPPr', ns)
-                if default_style is not None:
-                    latin_font = default_style.find('.//a:latin', ns)
-                    ea_font = default_style.find('.//a:ea', ns)
-                    cs_font = default_style.find('.//a:cs', ns)
-                    
-                    shape_dict["text_frame"]["default_paragraph_style"] = {
-                        "latin_font": {
-                            "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                            "resolved": resolve_theme_font(shape, latin_font.get('typeface')) if latin_font is not None else None
-                        },
-                        "east_asian_font": {
-                            "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                            "resolved": resolve_theme_font(shape, ea_font.get('typeface')) if ea_font is not None else None
-                        },
-                        "complex_script_font": {
-                            "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                            "resolved": resolve_theme_font(shape, cs_font.get('typeface')) if cs_font is not None else None
-                        }
-                    }
-            except Exception as e:
-                shape_dict["text_frame"]["default_style_error"] = str(e)
+            default_style = _find_first(_XP_DEFAULT_PPR, shape._element)
+            if default_style is not None:
+                latin_font, ea_font, cs_font = _script_fonts(default_style.find(A_DEF_RPR_TAG))
+                
+                shape_dict["text_frame"]["default_paragraph_style"] = {
+                    "latin_font": _font_entry(latin_font, shape, theme),
+                    "east_asian_font": _font_entry(ea_font, shape, theme),
+                    "complex_script_font": _font_entry(cs_font, shape, theme)
+                }
                 
             # Look for default text run properties
-            try:
-                default_run_style = shape._element.find('.//a:lstStyle/a:defPPr/a:defRPr', ns)
-                if default_run_style is not None:
+            default_run_style = _find_first(_XP_DEFAULT_RPR, shape._element)
+            if default_run_style is not None:
+                sz = default_run_style.get('sz')
+                try:
+                    size = int(sz) / 100 if sz else None
+                except ValueError as e:
+                    # A malformed sz leaves the rest of the shape readable
+                    shape_dict["text_frame"]["default_run_style_error"] = str(e)
+                else:
                     shape_dict["text_frame"]["default_run_style"] = {
-                        "size": int(default_run_style.get('sz')) / 100 if default_run_style.get('sz') else None,
+                        "size": size,
                         "bold": default_run_style.get('b') == '1',
                         "italic": default_run_style.get('i') == '1',
                         "underline": default_run_style.get('u') != 'none' if default_run_style.get('u') else False,
@@ -369,103 +579,72 @@ def shape_to_dict(shape: Any) -> Dict[str, Any]:
                     }
                     
                     # Get font information
-                    latin_font = default_run_style.find('.//a:latin', ns)
-                    ea_font = default_run_style.find('.//a:ea', ns)
-                    cs_font = default_run_style.find('.//a:cs', ns)
+                    latin_font, ea_font, cs_font = _script_fonts(default_run_style)
                     
-                    if any([latin_font, ea_font, cs_font]):
+                    if latin_font is not None or ea_font is not None or cs_font is not None:
                         shape_dict["text_frame"]["default_run_style"]["fonts"] = {
-                            "latin": {
-                                "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                                "resolved": resolve_theme_font(shape, latin_font.get('typeface')) if latin_font is not None else None
-                            },
-                            "east_asian": {
-                                "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                                "resolved": resolve_theme_font(shape, ea_font.get('typeface')) if ea_font is not None else None
-                            },
-                            "complex_script": {
-                                "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                                "resolved": resolve_theme_font(shape, cs_font.get('typeface')) if cs_font is not None else None
-                            }
+                            "latin": _font_entry(latin_font, shape, theme),
+                            "east_asian": _font_entry(ea_font, shape, theme),
+                            "complex_script": _font_entry(cs_font, shape, theme)
                         }
-            except Exception as e:
-                shape_dict["text_frame"]["default_run_style_error"] = str(e)
                 
             # Get direct shape-level font properties
-            shape_props = shape._element.find('.//a:pPr', ns)
-            if shape_props is not None:
-                latin_font = shape_props.find('.//a:latin', ns)
-                if latin_font is not None:
-                    theme_font = latin_font.get('typeface')
-                    shape_dict["text_frame"]["theme_font"] = theme_font
-                    shape_dict["text_frame"]["resolved_font"] = resolve_theme_font(shape, theme_font)
-
-        # Try to get text frame level defaults
-        try:
-            if hasattr(shape.text_frame, 'properties'):
-                shape_dict["text_frame"]["properties"] = {
-                    "margin_left": shape.text_frame.margin_left,
-                    "margin_right": shape.text_frame.margin_right,
-                    "margin_top": shape.text_frame.margin_top,
-                    "margin_bottom": shape.text_frame.margin_bottom,
-                    "vertical_anchor": str(shape.text_frame.vertical_anchor),
-                    "word_wrap": shape.text_frame.word_wrap,
-                    "auto_size": str(shape.text_frame.auto_size) if hasattr(shape.text_frame, 'auto_size') else None
-                }
-        except Exception as e:
-            shape_dict["text_frame"]["properties_error"] = str(e)
+            latin_font = _XP_SHAPE_LATIN(shape._element)
+            if latin_font:
+                theme_font = _typeface(latin_font[0])
+                shape_dict["text_frame"]["theme_font"] = theme_font
+                shape_dict["text_frame"]["resolved_font"] = _resolve_typeface(shape, theme_font, theme)
+
+        # python-pptx builds a new TextFrame proxy on every access
+        text_frame = shape.text_frame
+
+        # Text frame level defaults
+        shape_dict["text_frame"]["properties"] = {
+            "margin_left": _emu(text_frame.margin_left),
+            "margin_right": _emu(text_frame.margin_right),
+            "margin_top": _emu(text_frame.margin_top),
+            "margin_bottom": _emu(text_frame.margin_bottom),
+            "vertical_anchor": _enum_name(text_frame.vertical_anchor),
+            "word_wrap": text_frame.word_wrap,
+            "auto_size": _enum_name(text_frame.auto_size)
+        }
 
         # Process paragraphs
-        for p in shape.text_frame.paragraphs:
+        for p in text_frame.paragraphs:
             para_dict = {
                 "text": p.text,
                 "level": p.level,
-                "alignment": str(p.alignment) if hasattr(p, 'alignment') else None,
+                "alignment": _enum_name(p.alignment),
                 "runs": []
             }
 
-            # Try to get paragraph level font defaults
-            try:
-                if hasattr(p, 'font'):
-                    para_dict["default_font"] = {
-                        "name": p.font.name,
-                        "size": p.font.size.pt if p.font.size else None,
-                        "bold": p.font.bold,
-                        "italic": p.font.italic,
-                        "underline": p.font.underline
+            # Paragraph level font defaults; each .font access builds a new proxy
+            font = p.font
+            size = font.size
+            para_dict["default_font"] = {
+                "name": font.name,
+                "size": size.pt if size else None,
+                "bold": font.bold,
+                "italic": font.italic,
+                "underline": font.underline
+            }
+            # Try to get font info from XML
+            para_props = _leading_child(p._element, A_PPR_TAG)
+            if para_props is not None:
+                latin_font, ea_font, cs_font = _script_fonts(para_props.find(A_DEF_RPR_TAG))
+                
+                if latin_font is not None or ea_font is not None or cs_font is not None:
+                    para_dict["theme_fonts"] = {
+                        "latin": _font_entry(latin_font, shape, theme),
+                        "east_asian": _font_entry(ea_font, shape, theme),
+                        "complex_script": _font_entry(cs_font, shape, theme)
                     }
-                # Try to get font info from XML
-                if hasattr(p, '_element'):
-                    ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                    para_props = p._element.find('.//a:pPr', ns)
-                    if para_props is not None:
-                        latin_font = para_props.find('.//a:latin', ns)
-                        ea_font = para_props.find('.//a:ea', ns)
-                        cs_font = para_props.find('.//a:cs', ns)
-                        
-                        if any([latin_font, ea_font, cs_font]):
-                            para_dict["theme_fonts"] = {
-                                "latin": {
-                                    "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                                    "resolved": resolve_theme_font(shape, latin_font.get('typeface')) if latin_font is not None else None
-                                },
-                                "east_asian": {
-                                    "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                                    "resolved": resolve_theme_font(shape, ea_font.get('typeface')) if ea_font is not None else None
-                                },
-                                "complex_script": {
-                                    "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                                    "resolved": resolve_theme_font(shape, cs_font.get('typeface')) if cs_font is not None else None
-                                }
-                            }
-                        
-                            # For backward compatibility
-                            if latin_font is not None:
-                                theme_font = latin_font.get('typeface')
-                                para_dict["theme_font"] = theme_font
-                                para_dict["resolved_font"] = resolve_theme_font(shape, theme_font)
-            except Exception as e:
-                para_dict["font_error"] = str(e)
+                
+                    # For backward compatibility
+                    if latin_font is not None:
+                        theme_font = _typeface(latin_font)
+                        para_dict["theme_font"] = theme_font
+                        para_dict["resolved_font"] = _resolve_typeface(shape, theme_font, theme)
 
             for run in p.runs:
                 run_dict = {
@@ -474,84 +653,68 @@ def shape_to_dict(shape: Any) -> Dict[str, Any]:
                     "theme_font": None,
                     "resolved_font": None
                 }
-                try:
-                    if hasattr(run, 'font'):
-                        run_dict["font"] = {
-                            "name": run.font.name,
-                            "size": run.font.size.pt if run.font.size else None,
-                            "bold": run.font.bold,
-                            "italic": run.font.italic,
-                            "underline": run.font.underline,
+                font = run.font
+                size = font.size
+                run_dict["font"] = {
+                    "name": font.name,
+                    "size": size.pt if size else None,
+                    "bold": font.bold,
+                    "italic": font.italic,
+                    "underline": font.underline,
+                }
+                # Try to get run-level font info from XML; _Run keeps its a:r as _r
+                run_props = _leading_child(run._r, A_RPR_TAG)
+                if run_props is not None:
+                    latin_font, ea_font, cs_font = _script_fonts(run_props)
+                    
+                    if latin_font is not None or ea_font is not None or cs_font is not None:
+                        run_dict["theme_fonts"] = {
+                            "latin": _font_entry(latin_font, shape, theme),
+                            "east_asian": _font_entry(ea_font, shape, theme),
+                            "complex_script": _font_entry(cs_font, shape, theme)
                         }
-                    # Try to get run-level font info from XML
-                    if hasattr(run, '_element'):
-                        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                        run_props = run._element.find('.//a:rPr', ns)
-                        if run_props is not None:
-                            latin_font = run_props.find('.//a:latin', ns)
-                            ea_font = run_props.find('.//a:ea', ns)
-                            cs_font = run_props.find('.//a:cs', ns)
-                            
-                            if any([latin_font, ea_font, cs_font]):
-                                run_dict["theme_fonts"] = {
-                                    "latin": {
-                                        "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                                        "resolved": resolve_theme_font(shape, latin_font.get('typeface')) if latin_font is not None else None
-                                    },
-                                    "east_asian": {
-                                        "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                                        "resolved": resolve_theme_font(shape, ea_font.get('typeface')) if ea_font is not None else None
-                                    },
-                                    "complex_script": {
-                                        "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                                        "resolved": resolve_theme_font(shape, cs_font.get('typeface')) if cs_font is not None else None
-                                    }
-                                }
-                            
-                            # For backward compatibility
-                            if latin_font is not None:
-                                theme_font = latin_font.get('typeface')
-                                run_dict["theme_font"] = theme_font
-                                run_dict["resolved_font"] = resolve_theme_font(shape, theme_font)
-                except Exception as e:
-                    run_dict["font_error"] = str(e)
+                    
+                    # For backward compatibility
+                    if latin_font is not None:
+                        theme_font = _typeface(latin_font)
+                        run_dict["theme_font"] = theme_font
+                        run_dict["resolved_font"] = _resolve_typeface(shape, theme_font, theme)
                 para_dict["runs"].append(run_dict)
 
             shape_dict["text_frame"]["paragraphs"].append(para_dict)
 
     # Handle table if present
-    if hasattr(shape, 'has_table') and shape.has_table:
+    if has_table and shape.has_table:
+        table = shape.table
+        # A cell's row and column are its position in the nested lists
         shape_dict["table"] = {
-            "rows": len(shape.table.rows),
-            "columns": len(shape.table.columns),
-            "cells": [
-                [
-                    {
-                        "text": cell.text,
-                        "location": f"row {row_idx}, col {col_idx}"
-                    }
-                    for col_idx, cell in enumerate(row.cells)
-                ]
-                for row_idx, row in enumerate(shape.table.rows)
-            ]
+            "rows": len(table.rows),
+            "columns": len(table.columns),
+            "cells": [[{"text": cell.text} for cell in row.cells] for row in table.rows]
         }
+        if TABLE_STATS:
+            shape_dict["table"]["stats"] = table_text_stats(
+                [cell["text"] for row in shape_dict["table"]["cells"] for cell in row])
 
-    # Handle image if present
-    if hasattr(shape, 'image'):
+    # Handle image if present; only pictures (including picture placeholders)
+    # have one, and reading it loads the image part
+    if isinstance(shape, Picture):
         try:
+            image = shape.image
             shape_dict["image"] = {
-                "filename": shape.image.filename,
-                "content_type": shape.image.content_type,
-                "size": shape.image.size,
+                "filename": image.filename,
+                "content_type": image.content_type,
+                "size": image.size,
             }
-        except AttributeError:
+        except (AttributeError, ValueError):
+            # ValueError: linked picture with no embedded image
             shape_dict["image"] = None
 
     # Add placeholder information if available
-    if hasattr(shape, 'is_placeholder') and shape.is_placeholder:
+    if has_placeholder and shape.is_placeholder:
         try:
             shape_dict["placeholder"] = {
-                "type": str(shape.placeholder_format.type),
+                "type": _enum_name(shape.placeholder_format.type),
                 "idx": shape.placeholder_format.idx
             }
         except AttributeError:
@@ -568,151 +731,68 @@ def slide_to_dict(slide: Any, slide_index: int) -> Dict[str, Any]:
     }
 
     # Check if slide is hidden
-    if hasattr(slide, '_element'):
-        slide_dict["hidden"] = slide._element.get('show') == '0'
+    slide_dict["hidden"] = slide._element.get('show') == '0'
+
+    # Resolve theme codes for every shape on the slide against one map
+    theme = theme_context(slide)
 
-    # Get slide layout info
-    if hasattr(slide, 'slide_layout'):
-        layout_dict = {
-            "name": slide.slide_layout.name,
+    # Get slide layout info, with the theme fonts of its slide master
+    slide_layout = slide.slide_layout
+    layout_dict = {
+        "name": slide_layout.name,
+    }
+    master = slide_layout.slide_master
+    theme_part = theme_part_of(master.part)
+    font_scheme_elem = None
+    if theme_part is not None:
+        try:
+            font_scheme_elem = theme_font_scheme(theme_part)
+        except etree.XMLSyntaxError as e:
+            layout_dict["theme_access_error"] = str(e)
+
+    if font_scheme_elem is not None:
+        layout_dict["theme_fonts"] = {
+            "scheme_name": font_scheme_elem.get('name', 'Unknown'),
+            "major_fonts": _font_group_typefaces(_find_first(_XP_MAJOR_FONT, font_scheme_elem)),
+            "minor_fonts": _font_group_typefaces(_find_first(_XP_MINOR_FONT, font_scheme_elem))
         }
+
+    if "theme_access_error" not in layout_dict:
+        # Extract default text styles from the slide master
+        master_text_styles = extract_master_text_styles(master, slide, theme)
+        if master_text_styles is not None:
+            layout_dict["master_text_styles"] = master_text_styles
         
-        # Try to extract theme font information from the slide layout
-        try:
-            if hasattr(slide.slide_layout, 'slide_master'):
-                master = slide.slide_layout.slide_master
-                
-                # Access the theme through the part relationships
-                try:
-                    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-                    
-                    # Get the master part - part is on the SlideMaster object, not on _element
-                    master_part = master.part
-                    
-                    # Find theme relationships
-                    theme_rels = [rel for rel in master_part.rels.values() 
-                                 if rel.reltype == RT.THEME]
-                    
-                    if theme_rels:
-                        # Get the first theme part using the relationship ID
-                        theme_rel = theme_rels[0]
-                        theme_part = master_part.related_part(theme_rel.rId)
-                        
-                        # Parse the theme XML
-                        from xml.etree import ElementTree
-                        theme_element = ElementTree.fromstring(theme_part.blob)
-                        
-                        # Extract font scheme
-                        ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                        font_scheme_elem = theme_element.find('.//a:fontScheme', ns)
-                        
-                        if font_scheme_elem is not None:
-                            # Get font scheme name
-                            scheme_name = font_scheme_elem.get('name', 'Unknown')
-                            
-                            # Get major font element
-                            major_font_elem = font_scheme_elem.find('.//a:majorFont', ns)
-                            major_fonts = {}
-                            
-                            if major_font_elem is not None:
-                                latin = major_font_elem.find('.//a:latin', ns)
-                                ea = major_font_elem.find('.//a:ea', ns)
-                                cs = major_font_elem.find('.//a:cs', ns)
-                                
-                                major_fonts = {
-                                    "latin": latin.get('typeface') if latin is not None else None,
-                                    "east_asian": ea.get('typeface') if ea is not None else None,
-                                    "complex_script": cs.get('typeface') if cs is not None else None
-                                }
-                            
-                            # Get minor font element
-                            minor_font_elem = font_scheme_elem.find('.//a:minorFont', ns)
-                            minor_fonts = {}
-                            
-                            if minor_font_elem is not None:
-                                latin = minor_font_elem.find('.//a:latin', ns)
-                                ea = minor_font_elem.find('.//a:ea', ns)
-                                cs = minor_font_elem.find('.//a:cs', ns)
-                                
-                                minor_fonts = {
-                                    "latin": latin.get('typeface') if latin is not None else None,
-                                    "east_asian": ea.get('typeface') if ea is not None else None,
-                                    "complex_script": cs.get('typeface') if cs is not None else None
-                                }
-                            
-                            layout_dict["theme_fonts"] = {
-                                "scheme_name": scheme_name,
-                                "major_fonts": major_fonts,
-                                "minor_fonts": minor_fonts
-                            }
-                    
-                    # Try to extract default text styles from the slide master
-                    try:
-                        if hasattr(master, '_element'):
-                            ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-                                  'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
-                            
-                            # Get text styles from the slide master
-                            text_styles = master._element.find('.//p:txStyles', ns)
-                            if text_styles is not None:
-                                layout_dict["master_text_styles"] = {}
-                                
-                                # Title style
-                                title_style = text_styles.find('.//p:titleStyle', ns)
-                                if title_style is not None:
-                                    layout_dict["master_text_styles"]["title_style"] = extract_text_style_fonts(title_style, ns, slide)
-                                
-                                # Body style
-                                body_style = text_styles.find('.//p:bodyStyle', ns)
-                                if body_style is not None:
-                                    layout_dict["master_text_styles"]["body_style"] = extract_text_style_fonts(body_style, ns, slide)
-                                
-                                # Other style
-                                other_style = text_styles.find('.//p:otherStyle', ns)
-                                if other_style is not None:
-                                    layout_dict["master_text_styles"]["other_style"] = extract_text_style_fonts(other_style, ns, slide)
-                    except Exception as e:
-                        layout_dict["master_text_styles_error"] = str(e)
-                except Exception as e:
-                    layout_dict["theme_access_error"] = str(e)
-        except Exception as e:
-            layout_dict["theme_fonts_error"] = str(e)
-            
-        slide_dict["layout"] = layout_dict
+    slide_dict["layout"] = layout_dict
+
+    # Find the background, transition and timing in one walk of the slide
+    slide_parts = scan_slide_parts(slide._element)
 
     # Get background info if available
-    try:
-        background = slide._element.find('.//p:bg',
-            {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-        if background is not None:
-            slide_dict["background"] = ElementTree.tostring(background).decode()
-    except Exception:
-        slide_dict["background"] = None
+    background = slide_parts.get(P_BG_TAG)
+    if background is not None:
+        slide_dict["has_background"] = True
+        if INCLUDE_RAW_XML:
+            slide_dict["background"] = etree.tostring(background, encoding="unicode", with_tail=False)
 
     # Check for transitions
-    try:
-        transition = slide._element.find('.//p:transition',
-            {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-        if transition is not None:
-            slide_dict["has_transition"] = True
-            slide_dict["transition_xml"] = ElementTree.tostring(transition).decode()
-    except Exception:
-        slide_dict["has_transition"] = False
+    transition = slide_parts.get(P_TRANSITION_TAG)
+    if transition is not None:
+        slide_dict["has_transition"] = True
+        if INCLUDE_RAW_XML:
+            slide_dict["transition_xml"] = etree.tostring(transition, encoding="unicode", with_tail=False)
 
     # Check for animations
-    try:
-        timing = slide._element.find('.//p:timing',
-            {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-        if timing is not None:
-            slide_dict["has_animations"] = True
-            slide_dict["timing_xml"] = ElementTree.tostring(timing).decode()
-    except Exception:
-        slide_dict["has_animations"] = False
+    timing = slide_parts.get(P_TIMING_TAG)
+    if timing is not None:
+        slide_dict["has_animations"] = True
+        if INCLUDE_RAW_XML:
+            slide_dict["timing_xml"] = etree.tostring(timing, encoding="unicode", with_tail=False)
 
     # Convert each shape
     for shape in slide.shapes:
         try:
-            shape_dict = shape_to_dict(shape)
+            shape_dict = shape_to_dict(shape, theme)
             slide_dict["shapes"].append(shape_dict)
         except Exception as e:
             slide_dict["shapes"].append({
@@ -722,18 +802,31 @@ def slide_to_dict(slide: Any, slide_index: int) -> Dict[str, Any]:
 
     return slide_dict
 
-def extract_text_style_fonts(style_element: Any, ns: Dict[str, str], slide: Any) -> Dict[str, Any]:
+def extract_text_style_fonts(style_element: Any, slide: Any,
+                             theme: Optional[Tuple[Optional[str], Dict[str, str]]] = None) -> Dict[str, Any]:
     """Extract font information from a text style element."""
     result = {}
     
     try:
+        # Collect the default and outline level paragraph properties in one
+        # pass over the style's children
+        def_p_pr = None
+        levels = {}
+        for child in style_element:
+            if child.tag == A_DEF_PPR_TAG:
+                if def_p_pr is None:
+                    def_p_pr = child
+            else:
+                level = A_LEVEL_PPR_TAGS.get(child.tag)
+                if level is not None and level not in levels:
+                    levels[level] = child
+
         # Get default paragraph properties
-        def_p_pr = style_element.find('.//a:defPPr', ns)
         if def_p_pr is not None:
             result["default_paragraph"] = {}
             
             # Get default run properties
-            def_r_pr = def_p_pr.find('.//a:defRPr', ns)
+            def_r_pr = def_p_pr.find(A_DEF_RPR_TAG)
             if def_r_pr is not None:
                 result["default_paragraph"]["default_run"] = {
                     "size": int(def_r_pr.get('sz')) / 100 if def_r_pr.get('sz') else None,
@@ -743,32 +836,19 @@ def extract_text_style_fonts(style_element: Any, ns: Dict[str, str], slide: Any)
                 }
                 
                 # Get font information
-                latin_font = def_r_pr.find('.//a:latin', ns)
-                ea_font = def_r_pr.find('.//a:ea', ns)
-                cs_font = def_r_pr.find('.//a:cs', ns)
+                latin_font = _find_first(_XP_LATIN, def_r_pr)
+                ea_font = _find_first(_XP_EA, def_r_pr)
+                cs_font = _find_first(_XP_CS, def_r_pr)
                 
-                if any([latin_font, ea_font, cs_font]):
+                if latin_font is not None or ea_font is not None or cs_font is not None:
                     result["default_paragraph"]["default_run"]["fonts"] = {
-                        "latin": {
-                            "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                            "resolved": resolve_theme_font(slide, latin_font.get('typeface')) if latin_font is not None else None
-                        },
-                        "east_asian": {
-                            "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                            "resolved": resolve_theme_font(slide, ea_font.get('typeface')) if ea_font is not None else None
-                        },
-                        "complex_script": {
-                            "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                            "resolved": resolve_theme_font(slide, cs_font.get('typeface')) if cs_font is not None else None
-                        }
+                        "latin": _font_entry(latin_font, slide, theme),
+                        "east_asian": _font_entry(ea_font, slide, theme),
+                        "complex_script": _font_entry(cs_font, slide, theme)
                     }
         
         # Get level paragraph properties (for different outline levels)
-        level_p_prs = []
-        for i in range(1, 10):  # Check levels 1-9
-            level_p_pr = style_element.find(f'.//a:lvl{i}pPr', ns)
-            if level_p_pr is not None:
-                level_p_prs.append((i, level_p_pr))
+        level_p_prs = sorted(levels.items())
         
         if level_p_prs:
             result["levels"] = {}
@@ -777,7 +857,7 @@ def extract_text_style_fonts(style_element: Any, ns: Dict[str, str], slide: Any)
                 result["levels"][f"level_{level_idx}"] = {}
                 
                 # Get run properties for this level
-                r_pr = lvl_p_pr.find('.//a:defRPr', ns)
+                r_pr = lvl_p_pr.find(A_DEF_RPR_TAG)
                 if r_pr is not None:
                     result["levels"][f"level_{level_idx}"]["run_properties"] = {
                         "size": int(r_pr.get('sz')) / 100 if r_pr.get('sz') else None,
@@ -787,72 +867,182 @@ def extract_text_style_fonts(style_element: Any, ns: Dict[str, str], slide: Any)
                     }
                     
                     # Get font information
-                    latin_font = r_pr.find('.//a:latin', ns)
-                    ea_font = r_pr.find('.//a:ea', ns)
-                    cs_font = r_pr.find('.//a:cs', ns)
+                    latin_font = _find_first(_XP_LATIN, r_pr)
+                    ea_font = _find_first(_XP_EA, r_pr)
+                    cs_font = _find_first(_XP_CS, r_pr)
                     
-                    if any([latin_font, ea_font, cs_font]):
+                    if latin_font is not None or ea_font is not None or cs_font is not None:
                         result["levels"][f"level_{level_idx}"]["run_properties"]["fonts"] = {
-                            "latin": {
-                                "typeface": latin_font.get('typeface') if latin_font is not None else None,
-                                "resolved": resolve_theme_font(slide, latin_font.get('typeface')) if latin_font is not None else None
-                            },
-                            "east_asian": {
-                                "typeface": ea_font.get('typeface') if ea_font is not None else None,
-                                "resolved": resolve_theme_font(slide, ea_font.get('typeface')) if ea_font is not None else None
-                            },
-                            "complex_script": {
-                                "typeface": cs_font.get('typeface') if cs_font is not None else None,
-                                "resolved": resolve_theme_font(slide, cs_font.get('typeface')) if cs_font is not None else None
-                            }
+                            "latin": _font_entry(latin_font, slide, theme),
+                            "east_asian": _font_entry(ea_font, slide, theme),
+                            "complex_script": _font_entry(cs_font, slide, theme)
                         }
-    except Exception as e:
+    except ValueError as e:
+        # A malformed sz attribute; keep what was read before it
         result["error"] = str(e)
     
     return result
 
+def scan_slide_parts(sld: Any) -> Dict[str, Any]:
+    """Find the first background, transition and timing element of a slide.
+
+    Only the places these can occur are visited: p:bg is a child of p:cSld,
+    while p:transition and p:timing are children of p:sld, possibly wrapped in
+    mc:AlternateContent as PowerPoint does for newer transitions. The shape
+    tree, which holds nearly all of a slide's elements, is never walked.
+
+    Returns:
+        Dict mapping each tag in SLIDE_PART_TAGS that was found to its element
+    """
+    found = {}
+    for child in sld:
+        tag = child.tag
+        if tag == P_CSLD_TAG:
+            bg = child.find(P_BG_TAG)
+            if bg is not None:
+                found.setdefault(P_BG_TAG, bg)
+        elif tag in SLIDE_PART_TAGS:
+            found.setdefault(tag, child)
+        elif tag == MC_ALTERNATE_CONTENT_TAG:
+            for elem in child.iter(*SLIDE_PART_TAGS):
+                found.setdefault(elem.tag, elem)
+    return found
+
+def convert_slide(slide: Any, slide_index: int) -> Dict[str, Any]:
+    """Convert a slide, reporting a failure in place of the slide's dictionary."""
+    try:
+        return slide_to_dict(slide, slide_index)
+    except Exception as e:
+        return {
+            "error": f"Failed to convert slide {slide_index + 1}: {str(e)}",
+            "slide_number": slide_index + 1
+        }
+
+def _init_slide_worker(pptx_path: str, table_stats: bool, include_raw_xml: bool) -> None:
+    """Open the presentation once in each worker process."""
+    global _worker_presentation, TABLE_STATS, INCLUDE_RAW_XML
+    _worker_presentation = Presentation(pptx_path)
+    TABLE_STATS = table_stats
+    INCLUDE_RAW_XML = include_raw_xml
+
+def _slide_worker(slide_index: int) -> Dict[str, Any]:
+    """Convert one slide of the worker's presentation.
+
+    python-pptx objects cannot be pickled, so workers receive only the slide
+    index and read the slide from their own copy of the presentation.
+    """
+    return convert_slide(_worker_presentation.slides[slide_index], slide_index)
+
+def presentation_metadata(prs: Any) -> Dict[str, Any]:
+    """Collect the slide count, core properties and theme fonts of a presentation."""
+    return {
+        "slides_count": len(prs.slides),
+        "core_properties": {
+            "author": prs.core_properties.author,
+            "created": str(prs.core_properties.created) if prs.core_properties.created else None,
+            "modified": str(prs.core_properties.modified) if prs.core_properties.modified else None,
+            "title": prs.core_properties.title,
+            "subject": prs.core_properties.subject,
+            "keywords": prs.core_properties.keywords,
+            "comments": prs.core_properties.comments,
+            "category": prs.core_properties.category,
+        },
+        "theme_fonts": extract_theme_fonts(prs)
+    }
+
+def iter_slide_dicts(prs: Any, pptx_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the dictionary of each slide in order.
+
+    Larger decks are spread over worker processes; results are still yielded
+    in slide order as soon as each one is available. Only a few slides per
+    worker are submitted ahead of the consumer, so a slow writer does not let
+    every converted slide pile up in memory.
+    """
+    slide_count = len(prs.slides)
+    if SLIDE_WORKERS > 1 and slide_count > PARALLEL_SLIDE_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=SLIDE_WORKERS,
+                                 initializer=_init_slide_worker,
+                                 initargs=(str(pptx_path), TABLE_STATS, INCLUDE_RAW_XML)) as executor:
+            indices = iter(range(slide_count))
+            pending = deque(executor.submit(_slide_worker, idx) for idx in
+                            islice(indices, SLIDE_WORKERS * SLIDES_IN_FLIGHT_PER_WORKER))
+            while pending:
+                slide_dict = pending.popleft().result()
+                idx = next(indices, None)
+                if idx is not None:
+                    pending.append(executor.submit(_slide_worker, idx))
+                yield slide_dict
+    else:
+        for idx, slide in enumerate(prs.slides):
+            yield convert_slide(slide, idx)
+
 def presentation_to_dict(pptx_path: Path) -> Dict[str, Any]:
     """Convert entire presentation to a dictionary."""
     prs = Presentation(pptx_path)
-
-    # Basic presentation properties
-    pres_dict = {
-        "metadata": {
-            "slides_count": len(prs.slides),
-            "core_properties": {
-                "author": prs.core_properties.author,
-                "created": str(prs.core_properties.created) if prs.core_properties.created else None,
-                "modified": str(prs.core_properties.modified) if prs.core_properties.modified else None,
-                "title": prs.core_properties.title,
-                "subject": prs.core_properties.subject,
-                "keywords": prs.core_properties.keywords,
-                "comments": prs.core_properties.comments,
-                "category": prs.core_properties.category,
-            },
-            "theme_fonts": extract_theme_fonts(prs)
-        },
-        "slides": []
+    return {
+        "metadata": presentation_metadata(prs),
+        "slides": list(iter_slide_dicts(prs, pptx_path))
     }
 
-    # Convert each slide
-    for idx, slide in enumerate(prs.slides):
-        try:
-            slide_dict = slide_to_dict(slide, idx)
-            pres_dict["slides"].append(slide_dict)
-        except Exception as e:
-            pres_dict["slides"].append({
-                "error": f"Failed to convert slide {idx + 1}: {str(e)}",
-                "slide_number": idx + 1
-            })
+def _encode_indented(value: Any, option: int, newline: bytes) -> bytes:
+    """Encode value as JSON with every line after the first shifted by newline's indent."""
+    data = orjson.dumps(value, default=str, option=option)
+    if newline:
+        data = data.replace(b'\n', newline)
+    return data
 
-    return pres_dict
+def write_presentation_json(pptx_path: Path, out: BinaryIO, compact: bool = False) -> None:
+    """Write the presentation as UTF-8 JSON, one slide at a time.
+
+    The document has the layout of json.dumps(presentation_to_dict(...),
+    indent=2, default=str), or no whitespace at all when compact is set,
+    with non-ASCII text written as-is rather than \\u escaped. Each slide is
+    encoded and written as soon as it is converted instead of building the
+    whole document and its string first.
+
+    The metadata and the first slide are converted before anything is
+    written, so a failure there leaves out untouched. A failure on a later
+    slide leaves the JSON written so far truncated.
+    """
+    prs = Presentation(pptx_path)
+    if compact:
+        option = 0
+        outer, inner, colon = b'', b'', b':'
+    else:
+        option = orjson.OPT_INDENT_2
+        outer, inner, colon = b'\n  ', b'\n    ', b': '
+
+    metadata = _encode_indented(presentation_metadata(prs), option, outer)
+    slide_dicts = iter_slide_dicts(prs, pptx_path)
+    first_slide = next(slide_dicts, None)
+
+    out.write(b'{' + outer + b'"metadata"' + colon + metadata)
+    out.write(b',' + outer + b'"slides"' + colon + b'[')
+    if first_slide is not None:
+        out.write(inner + _encode_indented(first_slide, option, inner))
+        for slide_dict in slide_dicts:
+            out.write(b',' + inner + _encode_indented(slide_dict, option, inner))
+        out.write(outer)
+    out.write(b']' + outer[:1] + b'}\n')
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python script.py <path_to_pptx>")
+    global TABLE_STATS, INCLUDE_RAW_XML
+    args = sys.argv[1:]
+    if '--stats' in args:
+        args.remove('--stats')
+        TABLE_STATS = True
+    if '--xml' in args:
+        args.remove('--xml')
+        INCLUDE_RAW_XML = True
+    compact = '--compact' in args
+    if compact:
+        args.remove('--compact')
+
+    if len(args) != 1:
+        print("Usage: python script.py [--stats] [--xml] [--compact] <path_to_pptx>")
         sys.exit(1)
 
-    pptx_path = Path(sys.argv[1])
+    pptx_path = Path(args[0])
     if not pptx_path.exists():
         print(f"Error: File '{pptx_path}' does not exist")
         sys.exit(1)
@@ -862,8 +1052,7 @@ def main():
         sys.exit(1)
 
     try:
-        pres_dict = presentation_to_dict(pptx_path)
-        print(json.dumps(pres_dict, indent=2, default=str))
+        write_presentation_json(pptx_path, sys.stdout.buffer, compact)
     except Exception as e:
         print(f"Error processing presentation: {str(e)}", file=sys.stderr)
         sys.exit(1)
@@ -1,7 +1,8 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
-#     "markdown",
+#     "lxml",
+#     "markdown-it-py",
 #     "matplotlib",
 #     "python-pptx",
 #     "PySide6",
@@ -9,21 +10,22 @@
 # ///
 
 
+import functools
 import logging
-import markdown
 import sys
 from collections import defaultdict
+from markdown_it import MarkdownIt
 from matplotlib import font_manager as fm
 from pathlib import Path
 from pptx import Presentation
-from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.shapes.base import BaseShape
+from pptx.shapes.group import GroupShape
 from pptx.text.text import _Paragraph
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QPushButton, QFileDialog, QLineEdit, 
                             QTextEdit, QCheckBox, QGroupBox, QStatusBar, QLabel)
 from typing import Dict, List, Set, Tuple, Any
-from xml.etree import ElementTree
+from lxml import etree
 from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 
 
@@ -35,6 +37,8 @@ INTERNAL_FONT_MARKERS = frozenset({
     '+minor',    # Default minor font
     '@',         # Font fallback marker
 })
+# The markers as a tuple for str.startswith; they are already lowercase
+INTERNAL_FONT_PREFIXES = tuple(INTERNAL_FONT_MARKERS)
 
 THEME_FONT_CODES = {
     '+mj-lt': 'Major Latin',
@@ -47,6 +51,31 @@ THEME_FONT_CODES = {
     '+mn-sym': 'Minor Symbol',
 }
 
+NS_P = {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+NS_A = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
+
+# Slide effects: Clark-notation tags of p:sld children, and of the animation
+# elements anywhere under p:timing
+P_TRANSITION_TAG = f"{{{NS_P['p']}}}transition"
+P_TIMING_TAG = f"{{{NS_P['p']}}}timing"
+P_ANIMATION_TAGS = (f"{{{NS_P['p']}}}anim", f"{{{NS_P['p']}}}animEffect")
+
+# Theme font scheme, relative to the a:theme root and its font collections;
+# every step is a direct child, so no descendant searches are needed
+_XP_FONT_SCHEME = etree.XPath('./a:themeElements/a:fontScheme', namespaces=NS_A)
+_XP_MAJOR_FONT = etree.XPath('./a:majorFont', namespaces=NS_A)
+_XP_MINOR_FONT = etree.XPath('./a:minorFont', namespaces=NS_A)
+_XP_LATIN = etree.XPath('./a:latin', namespaces=NS_A)
+_XP_EA = etree.XPath('./a:ea', namespaces=NS_A)
+_XP_CS = etree.XPath('./a:cs', namespaces=NS_A)
+_XP_SYM = etree.XPath('./a:sym', namespaces=NS_A)
+
+MISSING_FONT_STATUS = "❌ Missing"
+
+# Renders the reports, which mix markdown with raw HTML tables and styles;
+# the CommonMark preset passes that HTML through
+REPORT_MARKDOWN = MarkdownIt('commonmark')
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,6 +84,11 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def _find_first(xpath: etree.XPath, element: Any) -> Any:
+    """Return the first node selected by a compiled XPath, or None."""
+    nodes = xpath(element)
+    return nodes[0] if nodes else None
+
 def find_hidden_slides(pptx_path: str) -> List[int]:
     prs = Presentation(pptx_path)
     hidden_slides = []
@@ -75,14 +109,14 @@ def count_words_in_shape(shape: BaseShape) -> int:
     
     try:
         # Handle text frames
-        if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+        if shape.has_text_frame:
             # Count words in text frame paragraphs
             for paragraph in shape.text_frame.paragraphs:
                 if paragraph.text.strip():
                     word_count += len(paragraph.text.split())
                 
         # Handle tables
-        if hasattr(shape, 'has_table') and shape.has_table:
+        if shape.has_table:
             for row in shape.table.rows:
                 for cell in row.cells:
                     for paragraph in cell.text_frame.paragraphs:
@@ -94,10 +128,32 @@ def count_words_in_shape(shape: BaseShape) -> int:
         
     return word_count
 
-def analyze_presentation_statistics(pptx_path: str) -> Dict[str, Any]:
-    """Analyze general statistics about the presentation."""
-    prs = Presentation(pptx_path)
-    stats = {
+def _record_slide_statistics(stats: Dict[str, Any], slide_num: int, slide: Any) -> None:
+    """Add a slide's hidden state and word count to the statistics."""
+    try:
+        # Check if slide is hidden
+        if hasattr(slide, '_element') and slide._element.get('show') == '0':
+            stats["hidden_slides"].append(slide_num)
+        
+        # Count words on this slide
+        slide_word_count = 0
+        for shape in slide.shapes:
+            slide_word_count += count_words_in_shape(shape)
+        
+        stats["slide_word_counts"][slide_num] = slide_word_count
+        stats["total_words"] += slide_word_count
+        
+        # Track slide with most words
+        if slide_word_count > stats["max_words_count"]:
+            stats["max_words_count"] = slide_word_count
+            stats["max_words_slide"] = slide_num
+        
+    except Exception as e:
+        logger.warning(f"Error analyzing slide {slide_num}: {e}")
+
+def _new_statistics(prs: Any) -> Dict[str, Any]:
+    """Return empty statistics for a presentation, filled in per slide."""
+    return {
         "total_slides": len(prs.slides),
         "hidden_slides": [],
         "total_words": 0,
@@ -105,74 +161,82 @@ def analyze_presentation_statistics(pptx_path: str) -> Dict[str, Any]:
         "max_words_slide": 0,
         "max_words_count": 0
     }
+
+def analyze_presentation_statistics(pptx_path: str) -> Dict[str, Any]:
+    """Analyze general statistics about the presentation."""
+    prs = Presentation(pptx_path)
+    stats = _new_statistics(prs)
     
     # Find hidden slides and count words per slide
     for slide_num, slide in enumerate(prs.slides, start=1):
-        try:
-            # Check if slide is hidden
-            if hasattr(slide, '_element') and slide._element.get('show') == '0':
-                stats["hidden_slides"].append(slide_num)
-            
-            # Count words on this slide
-            slide_word_count = 0
-            for shape in slide.shapes:
-                slide_word_count += count_words_in_shape(shape)
-            
-            stats["slide_word_counts"][slide_num] = slide_word_count
-            stats["total_words"] += slide_word_count
-            
-            # Track slide with most words
-            if slide_word_count > stats["max_words_count"]:
-                stats["max_words_count"] = slide_word_count
-                stats["max_words_slide"] = slide_num
-            
-        except Exception as e:
-            logger.warning(f"Error analyzing slide {slide_num}: {e}")
+        _record_slide_statistics(stats, slide_num, slide)
     
     return stats
 
-def generate_presentation_summary(pptx_path: str) -> str:
-    """Generate a summary section with general presentation statistics."""
-    stats = analyze_presentation_statistics(pptx_path)
-    
+def format_presentation_summary(stats: Dict[str, Any], pptx_path: str) -> str:
+    """Format the summary section from the presentation statistics."""
     # Get just the filename without the full path
     filename = Path(pptx_path).name
     
-    result = f"## Presentation Summary for {filename}\n"
+    parts = [f"## Presentation Summary for {filename}\n"]
     
     # Basic stats
-    result += f"Total slides: {stats['total_slides']}<br />\n"
+    parts.append(f"Total slides: {stats['total_slides']}<br />\n")
     
     # Hidden slides count
     hidden_count = len(stats["hidden_slides"])
     if hidden_count > 0:
-        result += f"Hidden slides: {hidden_count} ({', '.join(str(num) for num in sorted(stats['hidden_slides']))})<br />\n"
+        parts.append(f"Hidden slides: {hidden_count} ({', '.join(str(num) for num in sorted(stats['hidden_slides']))})<br />\n")
     else:
-        result += "Hidden slides: 0<br />\n"
+        parts.append("Hidden slides: 0<br />\n")
     
     # Word counts
-    result += f"Total words: {stats['total_words']}<br />\n"
+    parts.append(f"Total words: {stats['total_words']}<br />\n")
     
     if stats["max_words_count"] > 0:
-        result += f"Slide with most words: {stats['max_words_slide']} ({stats['max_words_count']} words)<br />\n"
+        parts.append(f"Slide with most words: {stats['max_words_slide']} ({stats['max_words_count']} words)<br />\n")
     
-    result += "***\n"
-    return result
+    parts.append("***\n")
+    return "".join(parts)
 
-def generate_hidden_slides_report(pptx_path: str) -> str:
-    hidden_slides = find_hidden_slides(pptx_path)
-    
-    result = ""
+def generate_presentation_summary(pptx_path: str) -> str:
+    """Generate a summary section with general presentation statistics."""
+    return format_presentation_summary(analyze_presentation_statistics(pptx_path), pptx_path)
 
-    result += "## Hidden Slides\n"
+def format_hidden_slides_report(hidden_slides: List[int]) -> str:
+    parts = []
+
+    parts.append("## Hidden Slides\n")
     
     if hidden_slides:
-        result += "Hidden slides: " + (", ".join(str(num) for num in sorted(hidden_slides))) + "\n"
+        parts.append("Hidden slides: " + (", ".join(str(num) for num in sorted(hidden_slides))) + "\n")
     else:
-        result += "(no hidden slides found)\n"
-    result += "***\n"
+        parts.append("(no hidden slides found)\n")
+    parts.append("***\n")
+
+    return "".join(parts)
 
-    return result
+def generate_hidden_slides_report(pptx_path: str) -> str:
+    return format_hidden_slides_report(find_hidden_slides(pptx_path))
+
+def _record_slide_effects(slides_with_transitions: Set[int], slides_with_animations: Set[int],
+                          slide_num: int, slide: Any) -> None:
+    """Add a slide's number to the transition and animation sets it belongs to."""
+    try:
+        # Check for transitions
+        transition = slide._element.find(P_TRANSITION_TAG)
+        if transition is not None:
+            slides_with_transitions.add(slide_num)
+        
+        # Check for animations
+        timing = slide._element.find(P_TIMING_TAG)
+        if timing is not None:
+            # Look for any animation elements, stopping at the first
+            if next(timing.iter(*P_ANIMATION_TAGS), None) is not None:
+                slides_with_animations.add(slide_num)
+                
+    except Exception as e:
+        logger.warning(f"Error processing slide {slide_num}: {e}")
 
 def find_animations_and_transitions(pptx_path: str) -> Tuple[Set[int], Set[int]]:
     """
@@ -191,76 +255,95 @@ def find_animations_and_transitions(pptx_path: str) -> Tuple[Set[int], Set[int]]
     slides_with_animations = set()
     
     for slide_num, slide in enumerate(prs.slides, start=1):
-        try:
-            # Check for transitions
-            transition = slide._element.find('./p:transition', 
-                                          {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-            if transition is not None:
-                slides_with_transitions.add(slide_num)
-            
-            # Check for animations
-            timing = slide._element.find('./p:timing',
-                                      {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-            if timing is not None:
-                # Look for any animation elements
-                anim_elements = timing.findall('.//p:anim',
-                                            {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'})
-                anim_elements.extend(timing.findall('.//p:animEffect',
-                                                  {'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}))
-                if anim_elements:
-                    slides_with_animations.add(slide_num)
-                    
-        except Exception as e:
-            logger.warning(f"Error processing slide {slide_num}: {e}")
-            continue
+        _record_slide_effects(slides_with_transitions, slides_with_animations, slide_num, slide)
             
     return slides_with_transitions, slides_with_animations
 
 def format_effects_report(slides_with_transitions: Set[int], slides_with_animations: Set[int]) -> str:
-    result = ""
+    parts = []
 
-    result += "## Transitions and Animations\n"
+    parts.append("## Transitions and Animations\n")
     
     if slides_with_transitions:
-        result += "Slides with transitions: " + (", ".join(str(num) for num in sorted(slides_with_transitions))) + "<br />\n"
+        parts.append("Slides with transitions: " + (", ".join(str(num) for num in sorted(slides_with_transitions))) + "<br />\n")
     else:
-        result += "(no transitions found)<br />\n"
+        parts.append("(no transitions found)<br />\n")
         
     if slides_with_animations:
-        result += "Slides with animations: " + (", ".join(str(num) for num in sorted(slides_with_animations))) + "\n"
+        parts.append("Slides with animations: " + (", ".join(str(num) for num in sorted(slides_with_animations))) + "\n")
     else:
-        result += "(no animations found)\n"
-    result += "***\n"
+        parts.append("(no animations found)\n")
+    parts.append("***\n")
 
-    return result
+    return "".join(parts)
 
 def generate_effects_report(pptx_path: str) -> str:
     transitions, animations = find_animations_and_transitions(pptx_path)
     return format_effects_report(transitions, animations)
     
-def get_system_fonts() -> Set[str]:
+@functools.lru_cache(maxsize=1)
+def get_system_fonts() -> Tuple[str, ...]:
     """
-    Get a set of all system fonts including both TTF and OTF formats.
+    Get the names of all system fonts including both TTF and OTF formats.
+    
+    The fonts are enumerated once per run of the analyzer and shared by
+    every report generated in it.
+    
+    Names are taken from matplotlib's font cache (fontManager.ttflist), which
+    already read each file's name table when it was built; only system font
+    files missing from that cache, such as fonts installed since, are opened.
     
     Returns:
-        A sorted set of font names available on the system.
+        A sorted tuple of the unique font names available on the system.
     """
-    font_names: List[str] = []
+    font_files = set(fm.findSystemFonts(fontpaths=None))
+    font_names: Set[str] = set()
     
-    fonts = fm.findSystemFonts(fontpaths=None)
+    # Use the cached names of the system font files
+    for cached_font in fm.fontManager.ttflist:
+        if cached_font.fname in font_files:
+            font_names.add(cached_font.name)
+            font_files.discard(cached_font.fname)
     
-    # Process each font file to get its name
-    for font in fonts:
+    # Process each remaining font file to get its name
+    for font in font_files:
         try:
             # Attempt to get the font properties
-            font_name = fm.FontProperties(fname=font).get_name()
-            font_names.append(font_name)
+            font_names.add(fm.FontProperties(fname=font).get_name())
         except Exception as e:
             # Log debug info about font loading errors
             logger.debug(f"Error loading font properties for {font}: {e}")
 
-    # Return sorted unique font names
-    return sorted(set(font_names))
+    # Return sorted unique font names; a tuple, as the result is shared
+    return tuple(sorted(font_names))
+
+@functools.lru_cache(maxsize=1)
+def get_system_font_lookup() -> Tuple[Set[str], Dict[str, str]]:
+    """
+    Build the tables used to match font names against the system fonts.
+
+    Like the font list itself, they are built once per run of the analyzer
+    rather than for every report.
+
+    Returns:
+        Tuple containing:
+        - Set of lowercased system font names, for exact matching
+        - Dictionary mapping normalized names (lowercase, no spaces, no
+          punctuation) to the system font name, for flexible matching
+    """
+    system_fonts = get_system_fonts()
+
+    # Create a normalized version of system fonts for flexible matching
+    system_fonts_lower = {s.lower().strip() for s in system_fonts}
+
+    # Create a mapping with normalized versions (no spaces, no punctuation)
+    normalized_system_fonts = {}
+    for font in system_fonts:
+        # Create normalized version (lowercase, no spaces, no punctuation)
+        normalized = ''.join(c.lower() for c in font if c.isalnum())
+        normalized_system_fonts[normalized] = font
+
+    return system_fonts_lower, normalized_system_fonts
 
 def analyze_paragraph_fonts(paragraph: _Paragraph) -> Dict[str, Dict[str, Any]]:
     """
@@ -282,16 +365,20 @@ def analyze_paragraph_fonts(paragraph: _Paragraph) -> Dict[str, Dict[str, Any]]:
             # Check if this run contains non-whitespace characters
             has_visible_text = bool(run.text.strip())
             
+            # Each .font access builds a new proxy, so read it once
+            font = run.font
+            
             # Get font size if available
             font_size = None
-            if hasattr(run.font, 'size') and run.font.size is not None:
+            size = font.size
+            if size is not None:
                 # Convert from EMUs to points (1 point = 12700 EMUs)
-                if isinstance(run.font.size, int):
-                    font_size = int(round(run.font.size / 12700))
+                if isinstance(size, int):
+                    font_size = int(round(size / 12700))
             
-            if hasattr(run, 'font') and run.font.name and not is_internal_font(run.font.name):
+            font_name = font.name
+            if font_name and not is_internal_font(font_name):
                 # Process normal font with name
-                font_name = run.font.name
                 
                 # Initialize font info if not already in dictionary
                 if font_name not in fonts:
@@ -338,7 +425,7 @@ def analyze_shape_fonts(shape: BaseShape) -> Dict[str, Dict[str, Any]]:
     
     try:
         # Handle text frames
-        if hasattr(shape, 'has_text_frame') and shape.has_text_frame:
+        if shape.has_text_frame:
             for paragraph in shape.text_frame.paragraphs:
                 paragraph_fonts = analyze_paragraph_fonts(paragraph)
                 # Merge results, keeping track of visible text status and sizes
@@ -357,7 +444,7 @@ def analyze_shape_fonts(shape: BaseShape) -> Dict[str, Dict[str, Any]]:
                         fonts[font_name]["sizes"].update(font_info["sizes"])
                 
         # Handle tables
-        if hasattr(shape, 'has_table') and shape.has_table:
+        if shape.has_table:
             for row in shape.table.rows:
                 for cell in row.cells:
                     for paragraph in cell.text_frame.paragraphs:
@@ -378,29 +465,65 @@ def analyze_shape_fonts(shape: BaseShape) -> Dict[str, Dict[str, Any]]:
                                 fonts[font_name]["sizes"].update(font_info["sizes"])
         
         # Handle group shapes - recursively process shapes within groups
-        if hasattr(shape, 'shape_type') and shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-            if hasattr(shape, 'shapes'):
-                for child_shape in shape.shapes:
-                    child_fonts = analyze_shape_fonts(child_shape)
-                    # Merge results
-                    for font_name, font_info in child_fonts.items():
-                        if font_name not in fonts:
-                            fonts[font_name] = {
+        if isinstance(shape, GroupShape):
+            for child_shape in shape.shapes:
+                child_fonts = analyze_shape_fonts(child_shape)
+                # Merge results
+                for font_name, font_info in child_fonts.items():
+                    if font_name not in fonts:
+                        fonts[font_name] = {
+                            "has_visible_text": False,
+                            "sizes": set()
+                        }
+                    
+                    # Update visibility
+                    fonts[font_name]["has_visible_text"] = fonts[font_name]["has_visible_text"] or font_info["has_visible_text"]
+                    
+                    # Add sizes if this font has visible text
+                    if font_info["has_visible_text"]:
+                        fonts[font_name]["sizes"].update(font_info["sizes"])
+                    
+    except Exception as e:
+        logger.debug(f"Error analyzing shape: {str(e)}")
+        
+    return fonts
+
+def _record_slide_fonts(font_usage: Dict[int, Dict[str, Dict[str, Any]]],
+                        all_fonts_info: Dict[str, Dict[str, Any]],
+                        slide_num: int, slide: Any) -> None:
+    """Add the fonts of a slide's shapes to the per-slide and overall font usage."""
+    try:
+        for shape in slide.shapes:
+            try:
+                shape_type = f"Text Shape: {shape.name}"
+                fonts = analyze_shape_fonts(shape)
+                
+                if fonts:
+                    font_usage[slide_num][shape_type] = fonts
+                    
+                    # Update global font tracking
+                    for font_name, font_info in fonts.items():
+                        if font_name not in all_fonts_info:
+                            all_fonts_info[font_name] = {
                                 "has_visible_text": False,
                                 "sizes": set()
                             }
                         
                         # Update visibility
-                        fonts[font_name]["has_visible_text"] = fonts[font_name]["has_visible_text"] or font_info["has_visible_text"]
+                        all_fonts_info[font_name]["has_visible_text"] = (
+                            all_fonts_info[font_name]["has_visible_text"] or font_info["has_visible_text"]
+                        )
                         
                         # Add sizes if this font has visible text
                         if font_info["has_visible_text"]:
-                            fonts[font_name]["sizes"].update(font_info["sizes"])
-                        
+                            all_fonts_info[font_name]["sizes"].update(font_info["sizes"])
+                    
+            except Exception as e:
+                logger.debug(f"Error processing shape in slide {slide_num}: {str(e)}")
+                continue
+                
     except Exception as e:
-        logger.debug(f"Error analyzing shape: {str(e)}")
-        
-    return fonts
+        logger.warning(f"Error processing slide {slide_num}: {str(e)}")
 
 def analyze_fonts(pptx_path: str) -> Tuple[Dict[int, Dict[str, Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
     """
@@ -416,47 +539,48 @@ def analyze_fonts(pptx_path: str) -> Tuple[Dict[int, Dict[str, Dict[str, Any]]],
     all_fonts_info = {}
     
     for slide_num, slide in enumerate(prs.slides, start=1):
-        try:
-            for shape in slide.shapes:
-                try:
-                    shape_type = f"Text Shape: {shape.name}" if hasattr(shape, 'name') else "Shape"
-                    fonts = analyze_shape_fonts(shape)
-                    
-                    if fonts:
-                        font_usage[slide_num][shape_type] = fonts
-                        
-                        # Update global font tracking
-                        for font_name, font_info in fonts.items():
-                            if font_name not in all_fonts_info:
-                                all_fonts_info[font_name] = {
-                                    "has_visible_text": False,
-                                    "sizes": set()
-                                }
-                            
-                            # Update visibility
-                            all_fonts_info[font_name]["has_visible_text"] = (
-                                all_fonts_info[font_name]["has_visible_text"] or font_info["has_visible_text"]
-                            )
-                            
-                            # Add sizes if this font has visible text
-                            if font_info["has_visible_text"]:
-                                all_fonts_info[font_name]["sizes"].update(font_info["sizes"])
-                        
-                except Exception as e:
-                    logger.debug(f"Error processing shape in slide {slide_num}: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.warning(f"Error processing slide {slide_num}: {str(e)}")
-            continue
+        _record_slide_fonts(font_usage, all_fonts_info, slide_num, slide)
 
     return font_usage, all_fonts_info
 
+def analyze_presentation(pptx_path: str, include_fonts: bool = True) -> Dict[str, Any]:
+    """
+    Gather everything the reports need in a single pass over the presentation.
+    
+    The presentation is opened once and each slide is visited once, rather
+    than once per report.
+    
+    Returns:
+        Dict containing:
+        - presentation: The opened presentation
+        - statistics: General statistics, as from analyze_presentation_statistics
+        - transitions, animations: Slide numbers with transitions or animations
+        - font_usage, all_fonts_info: Font usage, as from analyze_fonts (left
+          empty unless include_fonts is set)
+    """
+    prs = Presentation(pptx_path)
+    analysis = {
+        "presentation": prs,
+        "statistics": _new_statistics(prs),
+        "transitions": set(),
+        "animations": set(),
+        "font_usage": defaultdict(lambda: defaultdict(dict)),
+        "all_fonts_info": {}
+    }
+    
+    for slide_num, slide in enumerate(prs.slides, start=1):
+        _record_slide_statistics(analysis["statistics"], slide_num, slide)
+        _record_slide_effects(analysis["transitions"], analysis["animations"], slide_num, slide)
+        if include_fonts:
+            _record_slide_fonts(analysis["font_usage"], analysis["all_fonts_info"], slide_num, slide)
+    
+    return analysis
+
+@functools.lru_cache(maxsize=4096)
 def is_internal_font(font_name: str) -> bool:
     if not font_name:
         return True
-    font_name = font_name.lower()
-    return any(font_name.startswith(marker) for marker in INTERNAL_FONT_MARKERS)
+    return font_name.lower().startswith(INTERNAL_FONT_PREFIXES)
 
 def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
     """Extract theme font information from the presentation."""
@@ -482,25 +606,24 @@ def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
                     theme_part = master_part.related_part(theme_rel.rId)
                     
                     # Parse the theme XML
-                    theme_element = ElementTree.fromstring(theme_part.blob)
+                    theme_element = etree.fromstring(theme_part.blob)
                     
                     # Extract font scheme
-                    ns = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}
-                    font_scheme_elem = theme_element.find('.//a:fontScheme', ns)
+                    font_scheme_elem = _find_first(_XP_FONT_SCHEME, theme_element)
                     
                     if font_scheme_elem is not None:
                         # Get font scheme name
                         scheme_name = font_scheme_elem.get('name', 'Unknown')
                         
                         # Get major font element
-                        major_font_elem = font_scheme_elem.find('.//a:majorFont', ns)
+                        major_font_elem = _find_first(_XP_MAJOR_FONT, font_scheme_elem)
                         major_fonts = {}
                         
                         if major_font_elem is not None:
-                            latin = major_font_elem.find('.//a:latin', ns)
-                            ea = major_font_elem.find('.//a:ea', ns)
-                            cs = major_font_elem.find('.//a:cs', ns)
-                            sym = major_font_elem.find('.//a:sym', ns)
+                            latin = _find_first(_XP_LATIN, major_font_elem)
+                            ea = _find_first(_XP_EA, major_font_elem)
+                            cs = _find_first(_XP_CS, major_font_elem)
+                            sym = _find_first(_XP_SYM, major_font_elem)
                             
                             major_fonts = {
                                 "latin": latin.get('typeface') if latin is not None else None,
@@ -510,14 +633,14 @@ def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
                             }
                         
                         # Get minor font element
-                        minor_font_elem = font_scheme_elem.find('.//a:minorFont', ns)
+                        minor_font_elem = _find_first(_XP_MINOR_FONT, font_scheme_elem)
                         minor_fonts = {}
                         
                         if minor_font_elem is not None:
-                            latin = minor_font_elem.find('.//a:latin', ns)
-                            ea = minor_font_elem.find('.//a:ea', ns)
-                            cs = minor_font_elem.find('.//a:cs', ns)
-                            sym = minor_font_elem.find('.//a:sym', ns)
+                            latin = _find_first(_XP_LATIN, minor_font_elem)
+                            ea = _find_first(_XP_EA, minor_font_elem)
+                            cs = _find_first(_XP_CS, minor_font_elem)
+                            sym = _find_first(_XP_SYM, minor_font_elem)
                             
                             minor_fonts = {
                                 "latin": latin.get('typeface') if latin is not None else None,
@@ -538,16 +661,29 @@ def extract_theme_fonts(presentation: Any) -> Dict[str, Any]:
     
     return theme_fonts
 
+def font_install_status(font: str, system_fonts_lower: Set[str],
+                        normalized_system_fonts: Dict[str, str]) -> str:
+    """Return the local status of a font, matched flexibly against the system fonts."""
+    # First try exact match
+    if font.lower() in system_fonts_lower:
+        return "✅ Installed"
+    
+    # Try normalized matching (PowerPoint-like flexibility)
+    matched_font = normalized_system_fonts.get(''.join(c.lower() for c in font if c.isalnum()))
+    if matched_font is not None:
+        return f"✅ Installed (as '{matched_font}')"
+    return MISSING_FONT_STATUS
+
 def format_font_report(font_usage: Dict[int, Dict[str, Dict[str, Any]]], 
                      all_fonts_info: Dict[str, Dict[str, Any]],
-                     system_fonts: Set[str],
+                     system_font_lookup: Tuple[Set[str], Dict[str, str]],
                      presentation: Any,
                      font_size_threshold: int = 24) -> str:
-    """Create a formatted report showing font usage and theme fonts."""
-    result = ""
+    """Create a formatted report showing font usage and theme fonts, matched against get_system_font_lookup()."""
+    parts = []
 
     # Add CSS styling for tables
-    result += """<style>
+    parts.append("""<style>
 table {
     border-collapse: collapse;
     margin: 10px 0;
@@ -575,21 +711,14 @@ th {
     font-style: italic;
 }
 </style>
-"""
+""")
 
     # Filter out internal fonts
     all_fonts_info = {f.strip(): v for f, v in all_fonts_info.items() if not is_internal_font(f)}
     
-    # Create a normalized version of system fonts for flexible matching
-    system_fonts_lower = {s.lower().strip() for s in system_fonts}
-    
-    # Create a mapping with normalized versions (no spaces, no punctuation)
-    normalized_system_fonts = {}
-    for font in system_fonts:
-        # Create normalized version (lowercase, no spaces, no punctuation)
-        normalized = ''.join(c.lower() for c in font if c.isalnum())
-        normalized_system_fonts[normalized] = font
-    
+    # Lowercased and normalized system font names for flexible matching
+    system_fonts_lower, normalized_system_fonts = system_font_lookup
+
     # Create a mapping of fonts to the slides that use them, with visibility information
     font_to_slides: Dict[str, Dict[int, Dict[str, Any]]] = {}
     for slide_num, shapes in font_usage.items():
@@ -616,11 +745,16 @@ th {
                     if font_info["has_visible_text"]:
                         font_to_slides[font][slide_num]["sizes"].update(font_info["sizes"])
 
-    result += "## Custom Font Usage\n"
+    # Match each custom font against the system fonts once, for both the
+    # table and the summary
+    font_statuses = {font: font_install_status(font, system_fonts_lower, normalized_system_fonts)
+                     for font in font_to_slides if font != "(unknown)"}
+
+    parts.append("## Custom Font Usage\n")
     
     if font_to_slides:
-        result += "<table>\n"
-        result += "<tr><th>Font Name</th><th>Local Status</th><th>Used on Slides</th><th>Font Sizes</th><th>Notes</th></tr>\n"
+        parts.append("<table>\n")
+        parts.append("<tr><th>Font Name</th><th>Local Status</th><th>Used on Slides</th><th>Font Sizes</th><th>Notes</th></tr>\n")
         
         # Process fonts by moving unknown to the end but otherwise alphabetical
         sorted_fonts = sorted(
@@ -640,17 +774,7 @@ th {
             if is_unknown:
                 status = "<span class='unknown-font'>Unknown (theme/default font)</span>"
             else:
-                # First try exact match
-                if font.lower() in system_fonts_lower:
-                    status = "✅ Installed"
-                else:
-                    # Try normalized matching (PowerPoint-like flexibility)
-                    font_normalized = ''.join(c.lower() for c in font if c.isalnum())
-                    if font_normalized in normalized_system_fonts:
-                        matched_font = normalized_system_fonts[font_normalized]
-                        status = f"✅ Installed (as '{matched_font}')"
-                    else:
-                        status = "❌ Missing"
+                status = font_statuses[font]
                 
             # Convert slide numbers to a readable string, marking whitespace-only slides
             slides_info = sorted(font_to_slides[font].items())
@@ -716,77 +840,58 @@ th {
                 slides_list = ", ".join(str(slide) for slide in sorted(small_font_slides))
                 notes.append(f"<span class='small-font'>† = Small font (&lt;{font_size_threshold}pt) on slides {slides_list}</span>")
             
-            result += f"<tr><td>{font_name_display}</td><td>{status}</td><td>{slides_str}</td><td>{sizes_str}</td><td>{' '.join(notes)}</td></tr>\n"
+            parts.append(f"<tr><td>{font_name_display}</td><td>{status}</td><td>{slides_str}</td><td>{sizes_str}</td><td>{' '.join(notes)}</td></tr>\n")
         
-        result += "</table>\n"
+        parts.append("</table>\n")
     else:
-        result += "(no custom fonts used in presentation)\n"
+        parts.append("(no custom fonts used in presentation)\n")
     
     # Print theme fonts
-    result += "\n## Theme Fonts\n"
+    parts.append("\n## Theme Fonts\n")
     
     # Extract theme fonts
     theme_fonts = extract_theme_fonts(presentation)
+    theme_font_statuses = {
+        font: font_install_status(font, system_fonts_lower, normalized_system_fonts)
+        for fonts in [theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})]
+        for font in fonts.values() if font
+    }
     
     if "error" in theme_fonts:
-        result += f"Error accessing theme fonts: {theme_fonts['error']}\n"
+        parts.append(f"Error accessing theme fonts: {theme_fonts['error']}\n")
     else:
         if theme_fonts.get("scheme_name"):
-            result += f"Theme scheme name: {theme_fonts['scheme_name']}\n\n"
+            parts.append(f"Theme scheme name: {theme_fonts['scheme_name']}\n\n")
         
-        result += "<table>\n"
-        result += "<tr><th>Font Type</th><th>Font Name</th><th>Local Status</th></tr>\n"
+        parts.append("<table>\n")
+        parts.append("<tr><th>Font Type</th><th>Font Name</th><th>Local Status</th></tr>\n")
         
         # Process major fonts
         major_fonts = theme_fonts.get("major_fonts", {})
         for script, font in major_fonts.items():
             if font:
                 # Use flexible font matching for theme fonts too
-                if font.lower() in system_fonts_lower:
-                    status = "✅ Installed"
-                else:
-                    # Try normalized matching
-                    font_normalized = ''.join(c.lower() for c in font if c.isalnum())
-                    if font_normalized in normalized_system_fonts:
-                        matched_font = normalized_system_fonts[font_normalized]
-                        status = f"✅ Installed (as '{matched_font}')"
-                    else:
-                        status = "❌ Missing"
-                result += f"<tr><td>Major {script.replace('_', ' ').title()}</td><td>{font}</td><td>{status}</td></tr>\n"
+                status = theme_font_statuses[font]
+                parts.append(f"<tr><td>Major {script.replace('_', ' ').title()}</td><td>{font}</td><td>{status}</td></tr>\n")
         
         # Process minor fonts
         minor_fonts = theme_fonts.get("minor_fonts", {})
         for script, font in minor_fonts.items():
             if font:
                 # Use flexible font matching for theme fonts too
-                if font.lower() in system_fonts_lower:
-                    status = "✅ Installed"
-                else:
-                    # Try normalized matching
-                    font_normalized = ''.join(c.lower() for c in font if c.isalnum())
-                    if font_normalized in normalized_system_fonts:
-                        matched_font = normalized_system_fonts[font_normalized]
-                        status = f"✅ Installed (as '{matched_font}')"
-                    else:
-                        status = "❌ Missing"
-                result += f"<tr><td>Minor {script.replace('_', ' ').title()}</td><td>{font}</td><td>{status}</td></tr>\n"
+                status = theme_font_statuses[font]
+                parts.append(f"<tr><td>Minor {script.replace('_', ' ').title()}</td><td>{font}</td><td>{status}</td></tr>\n")
         
-        result += "</table>\n"
+        parts.append("</table>\n")
         
         if not (major_fonts or minor_fonts):
-            result += "(no theme fonts defined)\n"
+            parts.append("(no theme fonts defined)\n")
     
     # Print summary statistics
     total_fonts = len([font for font in font_to_slides.keys() if font != "(unknown)"])
     
     # Update missing fonts count to use normalized matching
-    missing_fonts = 0
-    for font in font_to_slides:
-        if font != "(unknown)":
-            font_lower = font.lower()
-            font_normalized = ''.join(c.lower() for c in font if c.isalnum())
-            if font_lower not in system_fonts_lower and font_normalized not in normalized_system_fonts:
-                missing_fonts += 1
+    missing_fonts = sum(1 for status in font_statuses.values() if status == MISSING_FONT_STATUS)
     
     unknown_fonts = 1 if "(unknown)" in font_to_slides else 0
     
@@ -827,30 +932,27 @@ th {
     )
     
     # Update missing theme fonts count with flexible matching
-    missing_theme_fonts = 0
-    for fonts_dict in [theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})]:
-        for font in fonts_dict.values():
-            if font:
-                font_lower = font.lower()
-                font_normalized = ''.join(c.lower() for c in font if c.isalnum())
-                if font_lower not in system_fonts_lower and font_normalized not in normalized_system_fonts:
-                    missing_theme_fonts += 1
+    missing_theme_fonts = sum(
+        1 for fonts in [theme_fonts.get("major_fonts", {}), theme_fonts.get("minor_fonts", {})]
+        for font in fonts.values()
+        if font and theme_font_statuses[font] == MISSING_FONT_STATUS
+    )
     
-    result += "\n## Fonts Summary\n"
-    result += f"Total custom fonts: {total_fonts}<br />\n"
-    result += f"Missing custom fonts: {missing_fonts}<br />\n"
+    parts.append("\n## Fonts Summary\n")
+    parts.append(f"Total custom fonts: {total_fonts}<br />\n")
+    parts.append(f"Missing custom fonts: {missing_fonts}<br />\n")
     
     # Only show whitespace-only fonts line if there are any
     if whitespace_only_fonts > 0:
-        result += f"Fonts used only for whitespace: {whitespace_only_fonts}<br />\n"
+        parts.append(f"Fonts used only for whitespace: {whitespace_only_fonts}<br />\n")
     
     if unknown_fonts > 0:
         slide_list = ", ".join(str(num) for num in sorted(slides_with_unknown_fonts))
-        result += f"<span class='unknown-font'>Unknown fonts (theme/default): {unknown_fonts} (on slides {slide_list})</span><br />\n"
+        parts.append(f"<span class='unknown-font'>Unknown fonts (theme/default): {unknown_fonts} (on slides {slide_list})</span><br />\n")
     
     if small_fonts > 0:
         slide_list = ", ".join(str(num) for num in sorted(slides_with_small_fonts))
-        result += f"<span class='small-font'>Fonts below {font_size_threshold}pt: {small_fonts} (on slides {slide_list})</span><br />\n"
+        parts.append(f"<span class='small-font'>Fonts below {font_size_threshold}pt: {small_fonts} (on slides {slide_list})</span><br />\n")
     
     # Add note about small font sizes in unknown fonts
     unknown_small_fonts = False
@@ -861,17 +963,17 @@ th {
                 break
     
     if unknown_small_fonts:
-        result += f"<span class='unknown-small-font'>Note: Small font sizes detected in unknown fonts</span><br />\n"
+        parts.append(f"<span class='unknown-small-font'>Note: Small font sizes detected in unknown fonts</span><br />\n")
     
-    result += f"Total theme fonts: {total_theme_fonts}<br />\n"
-    result += f"Missing theme fonts: {missing_theme_fonts}\n"
-    result += "***\n"
+    parts.append(f"Total theme fonts: {total_theme_fonts}<br />\n")
+    parts.append(f"Missing theme fonts: {missing_theme_fonts}\n")
+    parts.append("***\n")
 
-    return result
+    return "".join(parts)
 
 def generate_font_report(pptx_path: str, font_size_threshold: int) -> str:
     # Get system fonts
-    system_fonts = get_system_fonts()
+    system_font_lookup = get_system_font_lookup()
     
     # Open presentation
     prs = Presentation(pptx_path)
@@ -880,7 +982,7 @@ def generate_font_report(pptx_path: str, font_size_threshold: int) -> str:
     font_usage, all_fonts_info = analyze_fonts(pptx_path)
     
     # Format report
-    return format_font_report(font_usage, all_fonts_info, system_fonts, prs, font_size_threshold)
+    return format_font_report(font_usage, all_fonts_info, system_font_lookup, prs, font_size_threshold)
 
 class PowerPointAnalyzerGUI(QMainWindow):
     def __init__(self):
@@ -987,20 +1089,26 @@ class PowerPointAnalyzerGUI(QMainWindow):
             # Capture output
             output = ""
             
+            # Read the presentation once for all selected sections
+            analysis = analyze_presentation(file_path, include_fonts=self.fonts_check.isChecked())
+            stats = analysis["statistics"]
+            
             # Include the presentation summary first if selected
             if self.summary_check.isChecked():
-                output += generate_presentation_summary(file_path)
+                output += format_presentation_summary(stats, file_path)
             
             # Add other selected analysis sections
             if self.hidden_check.isChecked():
-                output += generate_hidden_slides_report(file_path)
+                output += format_hidden_slides_report(stats["hidden_slides"])
             if self.effects_check.isChecked():
-                output += generate_effects_report(file_path)
+                output += format_effects_report(analysis["transitions"], analysis["animations"])
             if self.fonts_check.isChecked():
-                output += generate_font_report(file_path, font_size_threshold)
+                output += format_font_report(analysis["font_usage"], analysis["all_fonts_info"],
+                                             get_system_font_lookup(), analysis["presentation"],
+                                             font_size_threshold)
 
             # Display results
-            html = markdown.markdown(output)
+            html = REPORT_MARKDOWN.render(output)
             self.results_text.setHtml(html)
             self.status_bar.showMessage("Analysis complete")
 